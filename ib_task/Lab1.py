@@ -0,0 +1,300 @@
+import os
+import mmap
+import stat
+import struct
+import numpy as np
+from bitarray import bitarray
+from bitarray.util import ba2int, int2ba
+from .key_schedule import get_key_schedule
+from .parallel import map_blocks
+
+# Shift functions
+def right_shift(array, n):
+    length = len(array)
+    res = bitarray(length)
+    res.setall(0)  # Initialize with zeros
+    if n < length:
+        res[n:] = array[:length - n]  # Shift bits to the right
+    return res
+
+def left_shift(array, n):
+    length = len(array)
+    res = bitarray(length)
+    res.setall(0)  # Initialize with zeros
+    if n < length:
+        res[:length - n] = array[n:]  # Shift bits to the left
+    return res
+
+# Transformation function for Feistel-like structure
+def F(left, key):
+    shifted_left = left_shift(left, 3)  # Left shift
+    shifted_right_key = right_shift(key, 2)  # Right shift key
+    transformed = shifted_left ^ shifted_right_key  # XOR with shifted key
+    return transformed
+
+# Transformation function using a round key that is already shifted (see KeySchedule)
+def F_scheduled(left, round_key):
+    return left_shift(left, 3) ^ round_key
+
+# Custom encryption and decryption functions (with block size checks)
+def encrypt(plaintext, key, num_rounds=2, block_size=64):
+    schedule = get_key_schedule(key, num_rounds)  # Round subkeys derived once for all blocks
+    ciphertext = bitarray()  # Initialize ciphertext
+    for index in range(0, len(plaintext), block_size):
+        block = plaintext[index:index + block_size]
+        half_size = block_size // 2
+        left = block[:half_size]
+        right = block[half_size:]
+
+        # Perform multiple rounds of encryption
+        for round_number in range(num_rounds):
+            transformed = F_scheduled(left, schedule.round_keys[round_number])  # Apply transformation function
+            new_right = transformed ^ right
+
+            if round_number == num_rounds - 1:
+                new_block = left + new_right  # Final round maintains order
+            else:
+                new_block = new_right + left  # Swap halves in intermediate rounds
+
+            left, right = new_right, left  # Swap halves for next round
+
+        ciphertext += new_block  # Append to ciphertext
+
+    return ciphertext
+
+def decrypt(ciphertext, key, num_rounds=2, block_size=64):
+    schedule = get_key_schedule(key, num_rounds)  # Round subkeys derived once for all blocks
+    plaintext = bitarray()  # Initialize plaintext
+    for index in range(0, len(ciphertext), block_size):
+        block = ciphertext[index:index + block_size]
+        half_size = block_size // 2
+        left = block[:half_size]
+        right = block[half_size:]
+
+        # Perform multiple rounds of decryption in reverse order
+        for round_number in range(num_rounds - 1, -1, -1):
+            transformed = F_scheduled(right, schedule.round_keys[round_number])  # Apply transformation
+            new_left = transformed ^ left
+
+            if round_number == 0:
+                new_block = right + new_left  # Final round maintains order
+            else:
+                new_block = new_left + right  # Swap halves in intermediate rounds
+
+            left, right = right, new_left  # Swap halves for next round
+
+        plaintext += new_block  # Append to plaintext
+
+    return plaintext
+
+# Convert a bitarray into a NumPy array of 64-bit blocks (big-endian, matching bitarray bit order)
+def bitarray_to_words(bits, block_size=64):
+    if block_size != 64:
+        raise ValueError("The NumPy engine only supports 64-bit blocks.")
+    if len(bits) % block_size != 0:
+        raise ValueError("Input length must be a multiple of the block size.")
+    return np.frombuffer(bits.tobytes(), dtype=">u8").astype(np.uint64)
+
+# Convert a NumPy array of 64-bit blocks back into a bitarray
+def words_to_bitarray(words):
+    bits = bitarray()
+    bits.frombytes(np.asarray(words, dtype=np.uint64).astype(">u8").tobytes())
+    return bits
+
+# F-ready round keys as uint32 scalars for the NumPy engine
+def round_key_words(key, num_rounds):
+    schedule = get_key_schedule(key, num_rounds)
+    return [np.uint32(round_key) for round_key in schedule.round_key_ints]
+
+# Vectorized Feistel rounds over all blocks at once (each word is one 64-bit block)
+def encrypt_words(words, key, num_rounds=2):
+    words = np.asarray(words, dtype=np.uint64)
+    left = (words >> np.uint64(32)).astype(np.uint32)  # High half of every block
+    right = (words & np.uint64(0xFFFFFFFF)).astype(np.uint32)  # Low half of every block
+
+    for round_key in round_key_words(key, num_rounds):
+        new_right = (left << np.uint32(3)) ^ round_key  # F(left, key_segment)
+        new_right ^= right
+        left, right = new_right, left  # Swap halves for next round
+
+    # The final round keeps the order, which undoes the last swap
+    return (right.astype(np.uint64) << np.uint64(32)) | left.astype(np.uint64)
+
+def decrypt_words(words, key, num_rounds=2):
+    words = np.asarray(words, dtype=np.uint64)
+    left = (words >> np.uint64(32)).astype(np.uint32)
+    right = (words & np.uint64(0xFFFFFFFF)).astype(np.uint32)
+
+    for round_key in reversed(round_key_words(key, num_rounds)):
+        new_left = (right << np.uint32(3)) ^ round_key  # F(right, key_segment)
+        new_left ^= left
+        left, right = right, new_left  # Swap halves for next round
+
+    return (left.astype(np.uint64) << np.uint64(32)) | right.astype(np.uint64)
+
+# Drop-in replacements for encrypt/decrypt using the NumPy engine (bit-identical output)
+def encrypt_numpy(plaintext, key, num_rounds=2, block_size=64):
+    words = bitarray_to_words(plaintext, block_size)
+    return words_to_bitarray(encrypt_words(words, key, num_rounds))
+
+def decrypt_numpy(ciphertext, key, num_rounds=2, block_size=64):
+    words = bitarray_to_words(ciphertext, block_size)
+    return words_to_bitarray(decrypt_words(words, key, num_rounds))
+
+# Default chunk size for streaming (a multiple of the 8-byte block)
+STREAM_CHUNK_SIZE = 1 << 20
+# Streams end with the plaintext length, so decryption can strip the zero padding of the last block
+STREAM_TRAILER = struct.Struct(">Q")
+
+# Read a file as chunks through mmap, so only one chunk is copied into memory at a time.
+# Pipes, devices and empty files cannot be memory-mapped (they report size 0), so they are read with plain reads.
+def iter_file_chunks(path, chunk_size=STREAM_CHUNK_SIZE):
+    with open(path, "rb") as file:
+        status = os.fstat(file.fileno())
+        if not stat.S_ISREG(status.st_mode) or status.st_size == 0:
+            while True:
+                chunk = file.read(chunk_size)
+                if not chunk:
+                    return
+                yield chunk
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            for start in range(0, len(mapped), chunk_size):
+                yield mapped[start:start + chunk_size]
+
+# Run a word-level transform over a stream of byte chunks, carrying partial blocks between chunks
+def _transform_stream(chunks, key, num_rounds, block_size, transform, pad):
+    if block_size != 64:
+        raise ValueError("Streaming only supports 64-bit blocks.")
+    schedule = get_key_schedule(key, num_rounds)
+    block_bytes = block_size // 8
+    pending = b""  # Bytes of an incomplete block left over from the previous chunk
+
+    for chunk in chunks:
+        if pending:
+            chunk = pending + bytes(chunk)
+        usable = len(chunk) - len(chunk) % block_bytes
+        if usable:
+            words = np.frombuffer(chunk, dtype=">u8", count=usable // block_bytes)
+            yield transform(words, schedule, num_rounds).astype(">u8").tobytes()
+        pending = bytes(chunk[usable:])
+
+    # Only the tail of the stream is ever padded
+    if pending:
+        if not pad:
+            raise ValueError("Ciphertext length must be a multiple of the block size.")
+        pending += b"\x00" * (block_bytes - len(pending))
+        words = np.frombuffer(pending, dtype=">u8")
+        yield transform(words, schedule, num_rounds).astype(">u8").tobytes()
+
+# Encrypt an iterable of byte chunks, yielding ciphertext chunks.
+# The final block is zero-padded and followed by STREAM_TRAILER holding the plaintext length.
+def encrypt_stream(chunks, key, num_rounds=2, block_size=64):
+    length = 0
+
+    def counted():
+        nonlocal length
+        for chunk in chunks:
+            length += len(chunk)
+            yield chunk
+
+    yield from _transform_stream(counted(), key, num_rounds, block_size, encrypt_words, pad=True)
+    yield STREAM_TRAILER.pack(length)
+
+# Apply Lab1.decrypt over a stream written by encrypt_stream (like decrypt, this does not invert encrypt).
+# The last output chunk is held back until the trailer is read, then cut to the recorded length.
+def decrypt_stream(chunks, key, num_rounds=2, block_size=64):
+    tail = bytearray()  # Most recent input bytes, which may be the trailer
+
+    def ciphertext():
+        for chunk in chunks:
+            tail.extend(chunk)
+            if len(tail) > STREAM_TRAILER.size:
+                body = bytes(tail[:-STREAM_TRAILER.size])
+                del tail[:-STREAM_TRAILER.size]
+                yield body
+
+    held = b""
+    written = 0
+    for output in _transform_stream(ciphertext(), key, num_rounds, block_size, decrypt_words, pad=False):
+        if held:
+            yield held
+            written += len(held)
+        held = output
+
+    if len(tail) != STREAM_TRAILER.size:
+        raise ValueError("Ciphertext is missing its length trailer.")
+    (length,) = STREAM_TRAILER.unpack(tail)
+    block_bytes = block_size // 8
+    if written + len(held) != -(-length // block_bytes) * block_bytes:
+        raise ValueError("The length trailer does not match the ciphertext.")
+    if length > written:
+        yield held[:length - written]
+
+# Encrypt a file of any size with constant memory
+def encrypt_file(input_path, output_path, key, num_rounds=2, chunk_size=STREAM_CHUNK_SIZE):
+    with open(output_path, "wb") as output:
+        for chunk in encrypt_stream(iter_file_chunks(input_path, chunk_size), key, num_rounds):
+            output.write(chunk)
+
+# Apply Lab1.decrypt over a file written by encrypt_file with constant memory (does not invert encrypt_file)
+def decrypt_file(input_path, output_path, key, num_rounds=2, chunk_size=STREAM_CHUNK_SIZE):
+    with open(output_path, "wb") as output:
+        for chunk in decrypt_stream(iter_file_chunks(input_path, chunk_size), key, num_rounds):
+            output.write(chunk)
+
+# Shard workers for the process pool (ECB blocks are independent of each other)
+def _encrypt_shard(words, start, stop, schedule, num_rounds):
+    return encrypt_words(words[start:stop], schedule, num_rounds)
+
+def _decrypt_shard(words, start, stop, schedule, num_rounds):
+    return decrypt_words(words[start:stop], schedule, num_rounds)
+
+# Encrypt/decrypt across all cores; output is identical to encrypt/decrypt
+def encrypt_parallel(plaintext, key, num_rounds=2, block_size=64, workers=None):
+    schedule = get_key_schedule(key, num_rounds)
+    words = bitarray_to_words(plaintext, block_size)
+    return words_to_bitarray(map_blocks(_encrypt_shard, words, (schedule, num_rounds), workers))
+
+def decrypt_parallel(ciphertext, key, num_rounds=2, block_size=64, workers=None):
+    schedule = get_key_schedule(key, num_rounds)
+    words = bitarray_to_words(ciphertext, block_size)
+    return words_to_bitarray(map_blocks(_decrypt_shard, words, (schedule, num_rounds), workers))
+
+if __name__ == "__main__":
+    # Test data for encryption and decryption
+    original_text = "Secret message"
+    original_bytes = original_text.encode("utf-8")
+
+    # Ensure even block size with proper padding
+    padded_bytes = original_bytes + b"\x00" * (8 - len(original_bytes) % 8)
+
+    # Convert to bitarray
+    original_bitarray = bitarray()
+    original_bitarray.frombytes(padded_bytes)  # Convert to bitarray
+
+    # Generate a random key
+    key_bytes = os.urandom(8)  # Generate random 8-byte key
+    key_bitarray = bitarray()  # Initialize bitarray for key
+    key_bitarray.frombytes(key_bytes)
+
+    # Encrypt and decrypt
+    num_rounds = 4
+    encrypted = encrypt(original_bitarray, key_bitarray, num_rounds)
+
+    # Decrypt the ciphertext
+    decrypted = decrypt(encrypted, key_bitarray, num_rounds)
+
+    # Convert to bytes for decoding
+    decrypted_bytes = decrypted.tobytes()  # Use `tobytes()` to convert to bytes
+
+    # Attempt decoding with UTF-8, falling back to Latin-1 if needed
+    try:
+        decrypted_text = decrypted_bytes.decode("utf-8")  # Try UTF-8
+    except UnicodeDecodeError:
+        decrypted_text = decrypted_bytes.decode("latin-1")  # Fallback to Latin-1
+
+    # Display results
+    print("Original Text:", original_text)
+    print("Encrypted:", encrypted)
+    print("Decrypted:", decrypted)
+    print("Decrypted Text:", decrypted_text)
@@ -0,0 +1,458 @@
+import os
+import numpy as np
+from bitarray import bitarray
+from bitarray.util import ba2int, int2ba
+from .key_schedule import get_key_schedule
+from .parallel import map_blocks
+
+# Define shift functions for bit-level manipulation
+def right_shift(array, n):
+    length = len(array)
+    res = bitarray(length)
+    res.setall(0)  # Initialize with zeros
+    if n < length:
+        res[n:] = array[:length - n]
+    return res
+
+def left_shift(array, n):
+    length = len(array)
+    res = bitarray(length)
+    res.setall(0)
+    if n < length:
+        res[:length - n] = array[n:]
+    return res
+
+# Helper function to convert byte strings to bitarrays
+def bytestring_to_bitarray(byte_string):
+    bit_arr = bitarray()
+    bit_arr.frombytes(byte_string)
+    return bit_arr
+
+# Custom transformation function for bit-level encryption
+def transformation(left, key):
+    shifted_left = left_shift(left, 3)  # Shift left by 3 bits
+    shifted_right_key = right_shift(key, 2)  # Shift right by 2 bits
+    result = shifted_left ^ shifted_right_key  # Apply XOR operation
+    return result
+
+# Transformation using a round key that is already shifted (see KeySchedule)
+def transformation_scheduled(left, round_key):
+    return left_shift(left, 3) ^ round_key
+
+# Block-based encryption with Feistel-like structure
+def encrypt_block(block, key, num_rounds=2):
+    schedule = get_key_schedule(key, num_rounds)  # Accepts a bitarray key or a prebuilt KeySchedule
+    block_size = len(block)
+    for round_number in range(num_rounds):
+        left = block[:block_size // 2]
+        right = block[block_size // 2:]
+
+        transformed = transformation_scheduled(left, schedule.round_keys[round_number]) ^ right
+
+        if round_number == num_rounds - 1:
+            new_block = left + transformed
+        else:
+            new_block = transformed + left
+
+        block = new_block
+    return block
+
+# Block-based decryption with reverse Feistel-like structure
+def decrypt_block(block, key, num_rounds=2):
+    schedule = get_key_schedule(key, num_rounds)
+    block_size = len(block)
+    for round_number in range(num_rounds):
+        left = block[:block_size // 2]
+        right = block[block_size // 2:]
+
+        round_key = schedule.round_keys[num_rounds - round_number - 1]
+        transformed = transformation_scheduled(right, round_key) ^ left
+
+        if round_number == num_rounds - 1:
+            new_block = right + transformed
+        else:
+            new_block = transformed + right
+
+        block = new_block
+    return block
+
+# Cipher Block Chaining (CBC) encryption
+def encrypt_CBC(plaintext, key, IV, num_rounds=2, block_size=64):
+    key = get_key_schedule(key, num_rounds)  # Expand the key once for every block
+    encrypted_result = bitarray()  # Initialize bitarray
+
+    for index in range(0, len(plaintext), block_size):
+        block = plaintext[index:index + block_size]
+
+        if index == 0:
+            block ^= IV  # XOR with IV for the first block
+        else:
+            block ^= encrypted_result[index - block_size:index]
+
+        encrypted_block = encrypt_block(block, key, num_rounds)  # Encrypt block
+        encrypted_result += encrypted_block  # Append to result
+
+    return encrypted_result
+
+# Cipher Block Chaining (CBC) decryption
+def decrypt_CBC(ciphertext, key, IV, num_rounds=2, block_size=64):
+    key = get_key_schedule(key, num_rounds)  # Expand the key once for every block
+    decrypted_result = bitarray()  # Initialize bitarray
+
+    for index in range(0, len(ciphertext), block_size):
+        block = ciphertext[index:index + block_size]
+
+        # Decrypt block
+        decrypted_block = decrypt_block(block, key, num_rounds)
+
+        if index == 0:
+            decrypted_block ^= IV  # XOR with IV for the first block
+        else:
+            decrypted_block ^= ciphertext[index - block_size:index]
+
+        decrypted_result += decrypted_block  # Append to result
+
+    return decrypted_result
+
+# Cipher Feedback (CFB) encryption
+def encrypt_CFB(plaintext, key, IV, num_rounds=2, block_size=64):
+    key = get_key_schedule(key, num_rounds)  # Expand the key once for every block
+    encrypted_result = bitarray()  # Initialize bitarray
+
+    for index in range(0, len(plaintext), block_size):
+        block = plaintext[index:index + block_size]
+
+        if index == 0:
+            encrypted_stream = encrypt_block(IV, key, num_rounds)  # Encrypt IV
+        else:
+            encrypted_stream = encrypt_block(encrypted_result[index - block_size:index], key, num_rounds)
+
+        encrypted_block = encrypted_stream ^ block  # XOR with plaintext block
+        encrypted_result += encrypted_block
+
+    return encrypted_result
+
+# Cipher Feedback (CFB) decryption
+def decrypt_CFB(ciphertext, key, IV, num_rounds=2, block_size=64):
+    key = get_key_schedule(key, num_rounds)  # Expand the key once for every block
+    decrypted_result = bitarray()  # Initialize bitarray
+
+    for index in range(0, len(ciphertext), block_size):
+        block = ciphertext[index:index + block_size]
+
+        if index == 0:
+            decrypted_stream = encrypt_block(IV, key, num_rounds)  # Encrypt IV
+        else:
+            decrypted_stream = encrypt_block(ciphertext[index - block_size:index], key, num_rounds)
+
+        decrypted_block = decrypted_stream ^ block  # XOR with ciphertext block
+        decrypted_result += decrypted_block
+
+    return decrypted_result
+
+# Convert between bitarrays and NumPy arrays of 64-bit blocks (big-endian, matching bitarray bit order)
+def bitarray_to_words(bits, block_size=64):
+    if block_size != 64:
+        raise ValueError("The NumPy engine only supports 64-bit blocks.")
+    if len(bits) % block_size != 0:
+        raise ValueError("Input length must be a multiple of the block size.")
+    return np.frombuffer(bits.tobytes(), dtype=">u8").astype(np.uint64)
+
+def words_to_bitarray(words):
+    bits = bitarray()
+    bits.frombytes(np.asarray(words, dtype=np.uint64).astype(">u8").tobytes())
+    return bits
+
+# Vectorized encrypt_block over many 64-bit blocks at once
+def encrypt_block_words(words, key, num_rounds=2):
+    schedule = get_key_schedule(key, num_rounds)
+    words = np.asarray(words, dtype=np.uint64)
+    left = (words >> np.uint64(32)).astype(np.uint32)
+    right = (words & np.uint64(0xFFFFFFFF)).astype(np.uint32)
+
+    for round_key in schedule.round_key_ints:
+        transformed = (left << np.uint32(3)) ^ np.uint32(round_key) ^ right
+        left, right = transformed, left
+
+    # The final round keeps the order, which undoes the last swap
+    return (right.astype(np.uint64) << np.uint64(32)) | left.astype(np.uint64)
+
+# Vectorized decrypt_block over many 64-bit blocks at once
+def decrypt_block_words(words, key, num_rounds=2):
+    schedule = get_key_schedule(key, num_rounds)
+    words = np.asarray(words, dtype=np.uint64)
+    left = (words >> np.uint64(32)).astype(np.uint32)
+    right = (words & np.uint64(0xFFFFFFFF)).astype(np.uint32)
+
+    for round_key in reversed(schedule.round_key_ints):
+        transformed = (right << np.uint32(3)) ^ np.uint32(round_key) ^ left
+        left = transformed  # decrypt_block keeps the right half in place between rounds
+
+    return (right.astype(np.uint64) << np.uint64(32)) | left.astype(np.uint64)
+
+# Previous ciphertext block for every block in words[start:stop] (the IV for the first block)
+def _previous_blocks(words, start, stop, iv_word):
+    if start > 0:
+        return words[start - 1:stop - 1]
+    return np.concatenate((np.array([iv_word], dtype=np.uint64), words[:stop - 1]))
+
+# Shard workers: CBC and CFB decryption only depend on known ciphertext, so shards are independent
+def _decrypt_CBC_shard(words, start, stop, schedule, num_rounds, iv_word):
+    return decrypt_block_words(words[start:stop], schedule, num_rounds) ^ _previous_blocks(words, start, stop, iv_word)
+
+def _decrypt_CFB_shard(words, start, stop, schedule, num_rounds, iv_word):
+    return encrypt_block_words(_previous_blocks(words, start, stop, iv_word), schedule, num_rounds) ^ words[start:stop]
+
+# CBC/CFB decryption across all cores; output is identical to decrypt_CBC/decrypt_CFB
+def decrypt_CBC_parallel(ciphertext, key, IV, num_rounds=2, block_size=64, workers=None):
+    schedule = get_key_schedule(key, num_rounds)
+    words = bitarray_to_words(ciphertext, block_size)
+    iv_word = bitarray_to_words(IV, block_size)[0]
+    return words_to_bitarray(map_blocks(_decrypt_CBC_shard, words, (schedule, num_rounds, iv_word), workers))
+
+def decrypt_CFB_parallel(ciphertext, key, IV, num_rounds=2, block_size=64, workers=None):
+    schedule = get_key_schedule(key, num_rounds)
+    words = bitarray_to_words(ciphertext, block_size)
+    iv_word = bitarray_to_words(IV, block_size)[0]
+    return words_to_bitarray(map_blocks(_decrypt_CFB_shard, words, (schedule, num_rounds, iv_word), workers))
+
+# Counter (CTR) mode: keystream block i is encrypt_block(IV + i), so any block can be computed on its own
+def ctr_keystream(key, IV, start_block, n_blocks, num_rounds=2):
+    iv_word = bitarray_to_words(IV)[0]
+    counters = iv_word + np.arange(start_block, start_block + n_blocks, dtype=np.uint64)  # Wraps modulo 2^64
+    return encrypt_block_words(counters, key, num_rounds)
+
+# CTR encryption of a bitarray of any length (no padding needed); decryption is the same operation
+def encrypt_CTR(plaintext, key, IV, num_rounds=2, block_size=64):
+    if block_size != 64:
+        raise ValueError("CTR mode only supports 64-bit blocks.")
+    n_blocks = -(-len(plaintext) // block_size)
+    keystream = words_to_bitarray(ctr_keystream(key, IV, 0, n_blocks, num_rounds))
+    return plaintext ^ keystream[:len(plaintext)]
+
+def decrypt_CTR(ciphertext, key, IV, num_rounds=2, block_size=64):
+    return encrypt_CTR(ciphertext, key, IV, num_rounds, block_size)
+
+# Decrypt `length` bytes starting at byte `offset` of a CTR ciphertext (bytes, mmap, or the bitarray
+# returned by encrypt_CTR) without earlier blocks
+def decrypt_range(ciphertext, key, IV, offset, length, num_rounds=2):
+    if offset < 0 or length < 0:
+        raise ValueError("Offset and length must be non-negative.")
+    if isinstance(ciphertext, bitarray):
+        data = ciphertext[offset * 8:(offset + length) * 8].tobytes()  # Offsets stay in bytes
+    else:
+        data = bytes(ciphertext[offset:offset + length])
+    chunk = np.frombuffer(data, dtype=np.uint8)
+    if len(chunk) == 0:
+        return b""
+
+    first_block = offset // 8
+    last_block = (offset + len(chunk) - 1) // 8
+    keystream = ctr_keystream(key, IV, first_block, last_block - first_block + 1, num_rounds)
+    keystream_bytes = keystream.astype(">u8").view(np.uint8)
+    skip = offset - first_block * 8
+    return (chunk ^ keystream_bytes[skip:skip + len(chunk)]).tobytes()
+
+# Shard worker: XOR each block with its own keystream block
+def _CTR_shard(words, start, stop, schedule, num_rounds, iv_word):
+    counters = iv_word + np.arange(start, stop, dtype=np.uint64)
+    return words[start:stop] ^ encrypt_block_words(counters, schedule, num_rounds)
+
+# CTR encryption/decryption across all cores; output is identical to encrypt_CTR
+def encrypt_CTR_parallel(plaintext, key, IV, num_rounds=2, block_size=64, workers=None):
+    if block_size != 64:
+        raise ValueError("CTR mode only supports 64-bit blocks.")
+    schedule = get_key_schedule(key, num_rounds)
+    full_length = len(plaintext) - len(plaintext) % block_size
+    words = bitarray_to_words(plaintext[:full_length], block_size)
+    iv_word = bitarray_to_words(IV, block_size)[0]
+    result = words_to_bitarray(map_blocks(_CTR_shard, words, (schedule, num_rounds, iv_word), workers))
+
+    # A trailing partial block is XORed with a truncated keystream block
+    if full_length < len(plaintext):
+        tail = plaintext[full_length:]
+        keystream = words_to_bitarray(ctr_keystream(schedule, IV, full_length // block_size, 1, num_rounds))
+        result += tail ^ keystream[:len(tail)]
+    return result
+
+def decrypt_CTR_parallel(ciphertext, key, IV, num_rounds=2, block_size=64, workers=None):
+    return encrypt_CTR_parallel(ciphertext, key, IV, num_rounds, block_size, workers)
+
+# Scalar encrypt_block on a 64-bit integer, for modes whose blocks must be chained one at a time
+def encrypt_block_int(word, round_keys):
+    left, right = word >> 32, word & 0xFFFFFFFF
+    for round_key in round_keys:
+        left, right = ((left << 3) & 0xFFFFFFFF) ^ round_key ^ right, left
+    return (right << 32) | left
+
+# Base class for incremental ciphers: accepts byte chunks of any length, buffers partial blocks
+# and carries the chaining register between update() calls
+class _StreamCipher:
+    block_bytes = 8
+
+    def __init__(self, key, IV, num_rounds=2):
+        self.schedule = get_key_schedule(key, num_rounds)
+        self.num_rounds = num_rounds
+        self.register = int(bitarray_to_words(IV)[0])  # Chaining value (or counter) as an integer
+        self._pending = bytearray()  # Incomplete block carried to the next call
+        self._finalized = False
+
+    # Number of output bytes the next update(data) call will produce
+    def output_length(self, data_length):
+        total = len(self._pending) + data_length
+        return total - total % self.block_bytes
+
+    # Process a chunk, writing whole output blocks into a preallocated buffer; returns bytes written
+    def update_into(self, data, out):
+        if self._finalized:
+            raise ValueError("Cipher has already been finalized.")
+        data = memoryview(data).cast("B")
+        needed = self.output_length(len(data))
+        if len(out) < needed:
+            raise ValueError("Output buffer is too small.")
+        target = np.frombuffer(out, dtype=np.uint8, count=needed)
+        written = 0
+        position = 0
+
+        # Complete the block left over from the previous call
+        if self._pending:
+            position = min(self.block_bytes - len(self._pending), len(data))
+            self._pending += data[:position]
+            if len(self._pending) < self.block_bytes:
+                return 0
+            written = self._write(np.frombuffer(self._pending, dtype=">u8"), target, 0)
+            self._pending.clear()
+
+        # Process every whole block of the chunk directly from the caller's buffer
+        full = (len(data) - position) // self.block_bytes * self.block_bytes
+        if full:
+            words = np.frombuffer(data[position:position + full], dtype=">u8")
+            written = self._write(words, target, written)
+        self._pending += data[position + full:]
+        return written
+
+    def update(self, data):
+        out = bytearray(self.output_length(len(memoryview(data).cast("B"))))
+        self.update_into(data, out)
+        return out
+
+    def finalize(self):
+        if self._finalized:
+            raise ValueError("Cipher has already been finalized.")
+        self._finalized = True
+        tail = bytes(self._pending)
+        self._pending.clear()
+        return self._finalize_tail(tail) if tail else b""
+
+    def _write(self, words, target, offset):
+        result = self._process(words.astype(np.uint64))
+        target[offset:offset + 8 * len(result)] = result.astype(">u8").view(np.uint8)
+        return offset + 8 * len(result)
+
+    # XOR a partial final block with the first bytes of one keystream block
+    def _xor_tail(self, tail, keystream_word):
+        keystream = keystream_word.to_bytes(8, "big")
+        return bytes(a ^ b for a, b in zip(tail, keystream))
+
+# Incremental CBC encryption; the final partial block is zero-padded like the one-shot functions expect
+class CBCEncryptor(_StreamCipher):
+    def _process(self, words):
+        round_keys = self.schedule.round_key_ints
+        register = self.register
+        result = []
+        for word in words.tolist():
+            register = encrypt_block_int(word ^ register, round_keys)
+            result.append(register)
+        self.register = register
+        return np.array(result, dtype=np.uint64)
+
+    def _finalize_tail(self, tail):
+        block = np.frombuffer(tail + b"\x00" * (self.block_bytes - len(tail)), dtype=">u8")
+        return self._process(block.astype(np.uint64)).astype(">u8").tobytes()
+
+# Incremental CBC decryption; blocks inside a chunk are decrypted together
+class CBCDecryptor(_StreamCipher):
+    def _process(self, words):
+        previous = np.concatenate((np.array([self.register], dtype=np.uint64), words[:-1]))
+        self.register = int(words[-1])
+        return decrypt_block_words(words, self.schedule, self.num_rounds) ^ previous
+
+    def _finalize_tail(self, tail):
+        raise ValueError("Ciphertext length must be a multiple of the block size.")
+
+# Incremental CFB encryption; a final partial block uses a truncated keystream block
+class CFBEncryptor(_StreamCipher):
+    def _process(self, words):
+        round_keys = self.schedule.round_key_ints
+        register = self.register
+        result = []
+        for word in words.tolist():
+            register = encrypt_block_int(register, round_keys) ^ word
+            result.append(register)
+        self.register = register
+        return np.array(result, dtype=np.uint64)
+
+    def _finalize_tail(self, tail):
+        return self._xor_tail(tail, encrypt_block_int(self.register, self.schedule.round_key_ints))
+
+# Incremental CFB decryption; the keystream for a whole chunk comes from known ciphertext
+class CFBDecryptor(_StreamCipher):
+    def _process(self, words):
+        previous = np.concatenate((np.array([self.register], dtype=np.uint64), words[:-1]))
+        self.register = int(words[-1])
+        return encrypt_block_words(previous, self.schedule, self.num_rounds) ^ words
+
+    def _finalize_tail(self, tail):
+        return self._xor_tail(tail, encrypt_block_int(self.register, self.schedule.round_key_ints))
+
+# Incremental CTR mode (encryption and decryption are the same operation)
+class CTRCipher(_StreamCipher):
+    def __init__(self, key, IV, num_rounds=2):
+        super().__init__(key, IV, num_rounds)
+        self.counter = 0  # Index of the next keystream block
+
+    def _process(self, words):
+        counters = np.uint64(self.register) + np.arange(self.counter, self.counter + len(words), dtype=np.uint64)
+        self.counter += len(words)
+        return encrypt_block_words(counters, self.schedule, self.num_rounds) ^ words
+
+    def _finalize_tail(self, tail):
+        counter = (self.register + self.counter) & 0xFFFFFFFFFFFFFFFF
+        return self._xor_tail(tail, encrypt_block_int(counter, self.schedule.round_key_ints))
+
+if __name__ == "__main__":
+    # Test data and initialization
+    input_text = "Top Secret Data"
+    input_bytes = input_text.encode("utf-8")
+
+    # Ensure proper padding for block consistency
+    block_size = 64
+    padded_input = input_bytes + b"\x00" * (block_size - len(input_bytes) % block_size)
+
+    # Convert to bitarray
+    input_bitarray = bytestring_to_bitarray(padded_input)
+
+    # Generate random key and initialization vector
+    key_bytes = os.urandom(8)
+    key_bitarray = bytestring_to_bitarray(key_bytes)
+
+    IV_bytes = os.urandom(8)
+    IV_bitarray = bytestring_to_bitarray(IV_bytes)
+
+    # Encrypt using CFB mode
+    cfb_encrypted = encrypt_CFB(input_bitarray, key_bitarray, IV_bitarray, num_rounds=4)
+
+    # Decrypt using CFB mode
+    cfb_decrypted = decrypt_CFB(cfb_encrypted, key_bitarray, IV_bitarray, num_rounds=4)
+
+    # Convert decrypted result to bytes and attempt to decode
+    cfb_decrypted_bytes = cfb_decrypted.tobytes()
+
+    # Use UTF-8 decoding, fallback to latin-1 in case of error
+    try:
+        cfb_decrypted_text = cfb_decrypted_bytes.decode("utf-8").rstrip("\x00")  # Remove padding
+    except UnicodeDecodeError:
+        cfb_decrypted_text = cfb_decrypted_bytes.decode("latin-1").rstrip("\x00")  # Fallback to latin-1
+
+    print("CFB Encrypted:", cfb_encrypted)
+    print("CFB Decrypted:", cfb_decrypted_text)
@@ -0,0 +1,460 @@
+import numpy as np
+from collections import defaultdict
+from math import erfc, gcd, sqrt
+from .parallel import fill_array
+
+# Parameters for the Linear Congruential Generator (LCG)
+initial_seed = 0  # Starting seed for the LCG
+M = 101  # Multiplier
+C = 1  # Increment
+P = 2^32  # Modulus for the LCG
+
+# Function to generate random numbers with LCG
+def lcg(seed, M, C, P):
+    new_seed = (seed * M + C) % P  # LCG formula to generate new seed
+    rand_val = new_seed / P  # Normalize random value between 0 and 1
+    return rand_val, new_seed
+
+# Function to detect the cycle length in LCG
+def detect_cycle(seed, M, C, P):
+    visited = defaultdict(int)  # Dictionary to track unique seeds
+    count = 0  # Counter for the number of generated seeds
+    current_seed = seed  # Start with the given seed
+    max_iterations = 10000  # Safety limit to prevent infinite loops
+
+    # Generate random numbers until a cycle is detected
+    while current_seed not in visited:
+        if count > max_iterations:  # Safety break condition
+            raise Exception("Loop exceeded maximum iterations. Possible infinite loop.")
+
+        visited[current_seed] = count  # Store the seed's position
+        _, current_seed = lcg(current_seed, M, C, P)  # Generate the next random number
+        count += 1  # Increment the counter
+
+    # Calculate the cycle length
+    cycle_length = count - visited[current_seed]  # Difference between current count and first occurrence
+    return cycle_length
+
+# Brent's cycle detection: same result as detect_cycle, but O(1) memory
+def brent_cycle_length(seed, M, C, P, max_iterations=None):
+    power = cycle_length = 1
+    tortoise = seed
+    _, hare = lcg(seed, M, C, P)
+    steps = 1
+    while tortoise != hare:
+        if max_iterations is not None and steps > max_iterations:
+            raise Exception("Loop exceeded maximum iterations. Possible infinite loop.")
+        if power == cycle_length:  # Start a new power of two
+            tortoise = hare
+            power *= 2
+            cycle_length = 0
+        _, hare = lcg(hare, M, C, P)
+        cycle_length += 1
+        steps += 1
+    return cycle_length
+
+# Deterministic Miller-Rabin for n < 3.3e24 (probabilistic beyond that)
+def is_probable_prime(n):
+    if n < 2:
+        return False
+    small_primes = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)
+    for p in small_primes:
+        if n % p == 0:
+            return n == p
+    d, r = n - 1, 0
+    while d % 2 == 0:
+        d //= 2
+        r += 1
+    for a in small_primes:
+        x = pow(a, d, n)
+        if x in (1, n - 1):
+            continue
+        for _ in range(r - 1):
+            x = x * x % n
+            if x == n - 1:
+                break
+        else:
+            return False
+    return True
+
+# Pollard-Brent rho: returns a non-trivial factor of a composite n
+def _pollard_rho(n):
+    if n % 2 == 0:
+        return 2
+    increment = 1
+    while True:
+        x = y = 2
+        factor = 1
+        while factor == 1:
+            x = (x * x + increment) % n
+            y = (y * y + increment) % n
+            y = (y * y + increment) % n
+            factor = gcd(abs(x - y), n)
+        if factor != n:
+            return factor
+        increment += 1
+
+# Prime factorization as {prime: exponent}
+def factorize(n):
+    factors = defaultdict(int)
+    for p in (2, 3, 5, 7, 11, 13):
+        while n % p == 0:
+            factors[p] += 1
+            n //= p
+    pending = [n] if n > 1 else []
+    while pending:
+        value = pending.pop()
+        if is_probable_prime(value):
+            factors[value] += 1
+        else:
+            factor = _pollard_rho(value)
+            pending += [factor, value // factor]
+    return dict(factors)
+
+# Hull-Dobell theorem: the LCG has full period P (for every seed) exactly when these hold
+def hull_dobell_full_period(M, C, P, factors=None):
+    factors = factors or factorize(P)
+    if gcd(C, P) != 1:
+        return False
+    if any((M - 1) % p != 0 for p in factors):
+        return False
+    if P % 4 == 0 and (M - 1) % 4 != 0:
+        return False
+    return True
+
+# Cycle length from the factorization of P, in milliseconds even for 2^64-sized moduli.
+# Within each p^e the tail is at most e steps and the period divides p^e * phi(p^e), so the exact
+# period is found by dividing prime factors out of that bound while the jump still returns to the cycle.
+def lcg_cycle_length(seed, M, C, P):
+    if P == 1:
+        return 1
+    M, C, seed = M % P, C % P, seed % P
+    modulus_factors = factorize(P)
+    if hull_dobell_full_period(M, C, P, modulus_factors):
+        return P
+
+    # Exponents of a multiple of the period: lcm of p^(2e-1) * (p - 1) over every p^e dividing P
+    bound = defaultdict(int)
+    for p, e in modulus_factors.items():
+        bound[p] = max(bound[p], 2 * e - 1)
+        for q, k in factorize(p - 1).items():
+            bound[q] = max(bound[q], k)
+
+    # Move past any tail so the reference point lies on the cycle
+    on_cycle = lcg_jump(seed, max(modulus_factors.values()), M, C, P)
+    period = 1
+    for q, k in bound.items():
+        period *= q ** k
+    for q in bound:
+        while period % q == 0 and lcg_jump(on_cycle, period // q, M, C, P) == on_cycle:
+            period //= q
+    return period
+
+# Function to generate an array of random numbers
+def generate_random_array(seed, length, M, C, P):
+    random_values = []  # List to store random values
+    current_seed = seed  # Initialize with the starting seed
+
+    # Generate the specified number of random values
+    for _ in range(length):
+        if len(random_values) > 10000:  # Safety limit to prevent infinite loops
+            raise Exception("Generated too many random numbers. Check for errors.")
+
+        rand_val, current_seed = lcg(current_seed, M, C, P)  # Generate random number
+        random_values.append(rand_val)  # Store in the list
+
+    return random_values
+
+# Default number of values produced per chunk by the vectorized generator
+LCG_CHUNK_SIZE = 1 << 20
+
+# Coefficients (A, B) of the LCG applied k times: seed_k = (A * seed + B) % P, in O(log k) steps
+def lcg_jump_coefficients(k, M, C, P):
+    A, B = 1 % P, 0  # Identity map
+    step_mult, step_inc = M % P, C % P  # The map for 2^i steps
+    while k:
+        if k & 1:
+            A, B = (step_mult * A) % P, (step_mult * B + step_inc) % P
+        step_mult, step_inc = (step_mult * step_mult) % P, (step_mult * step_inc + step_inc) % P
+        k >>= 1
+    return A, B
+
+# Seed after k steps of the LCG, without generating the values in between
+def lcg_jump(seed, k, M, C, P):
+    A, B = lcg_jump_coefficients(k, M, C, P)
+    return (A * seed + B) % P
+
+# Choose the array type and affine update for the modulus: exact uint64 for P <= 2^32,
+# wrap-around uint64 for power-of-two moduli up to 2^64, Python integers otherwise
+def _lcg_affine(P):
+    if P <= 1 << 32:
+        return np.uint64, lambda A, states, B: (np.uint64(A) * states + np.uint64(B)) % np.uint64(P)
+    if P & (P - 1) == 0 and P <= 1 << 64:
+        mask = np.uint64(P - 1)
+        return np.uint64, lambda A, states, B: (np.uint64(A) * states + np.uint64(B)) & mask
+    return object, lambda A, states, B: (A * states + B) % P
+
+# The next `count` seeds after `seed`, filled by doubling: each pass jumps the filled prefix ahead at once
+def lcg_states(seed, count, M, C, P):
+    dtype, affine = _lcg_affine(P)
+    states = np.empty(count, dtype=dtype)
+    if count == 0:
+        return states
+
+    states[0] = (seed * M + C) % P
+    filled = 1
+    while filled < count:
+        size = min(filled, count - filled)
+        A, B = lcg_jump_coefficients(filled, M, C, P)
+        states[filled:filled + size] = affine(A, states[:size], B)
+        filled += size
+    return states
+
+# Seeds as floats in [0, 1), rounded like lcg()'s int / int division. Float64 division is exact enough
+# while seeds and P fit in 53 bits or P is a power of two; larger moduli divide each Python integer instead.
+def _normalize(states, P):
+    if states.dtype == object and P > 1 << 53:
+        return np.fromiter((state / P for state in states), dtype=np.float64, count=len(states))
+    return states.astype(np.float64) / P
+
+# Vectorized generate_random_array: values start..start+length-1 of the sequence, with no length limit
+def lcg_array(seed, length, M, C, P, start=0):
+    states = lcg_states(lcg_jump(seed, start, M, C, P), length, M, C, P)
+    return _normalize(states, P)
+
+# Yield the sequence as NumPy arrays of chunk_size values (endless when total is None)
+def lcg_chunks(seed, M, C, P, chunk_size=LCG_CHUNK_SIZE, start=0, total=None):
+    current_seed = lcg_jump(seed, start, M, C, P)
+    remaining = total
+    while remaining is None or remaining > 0:
+        size = chunk_size if remaining is None else min(chunk_size, remaining)
+        states = lcg_states(current_seed, size, M, C, P)
+        current_seed = int(states[-1])
+        if remaining is not None:
+            remaining -= size
+        yield _normalize(states, P)
+
+# A substream of the LCG sequence: values offset, offset + stride, offset + 2 * stride, ...
+# (value i of the sequence is lcg_array(seed, ...)[i]). Every substream jumps straight to its
+# first value, so workers never step through another worker's values.
+class LCGSubstream:
+    def __init__(self, seed, M, C, P, offset, stride=1, length=None):
+        self.seed, self.M, self.C, self.P = seed, M, C, P
+        self.offset = offset
+        self.stride = stride
+        self.length = length  # None for an unbounded substream
+        self.stride_M, self.stride_C = lcg_jump_coefficients(stride, M, C, P)  # One step of the substream
+
+    # Substream values start..start+count-1 as floats in [0, 1)
+    def array(self, count, start=0):
+        if self.length is not None:
+            count = max(0, min(count, self.length - start))
+        if count == 0:
+            return np.empty(0, dtype=np.float64)
+        first_state = lcg_jump(self.seed, self.offset + start * self.stride + 1, self.M, self.C, self.P)
+        rest = lcg_states(first_state, count - 1, self.stride_M, self.stride_C, self.P)
+        states = np.concatenate((np.array([first_state], dtype=rest.dtype), rest))
+        return _normalize(states, self.P)
+
+    # Yield the substream as arrays of chunk_size values
+    def chunks(self, chunk_size=LCG_CHUNK_SIZE):
+        start = 0
+        while self.length is None or start < self.length:
+            values = self.array(chunk_size, start)
+            start += len(values)
+            yield values
+
+# Split the sequence into n_streams non-overlapping substreams.
+# "block": stream j covers values [j * block_size, (j + 1) * block_size); concatenated in order they
+# give the serial sequence. "leapfrog": stream j covers values j, j + n_streams, ...; interleaved they
+# give the serial sequence.
+def split_streams(seed, n_streams, M, C, P, method="block", block_size=LCG_CHUNK_SIZE):
+    if method == "block":
+        return [LCGSubstream(seed, M, C, P, j * block_size, 1, block_size) for j in range(n_streams)]
+    if method == "leapfrog":
+        return [LCGSubstream(seed, M, C, P, j, n_streams) for j in range(n_streams)]
+    raise ValueError(f"Unknown stream split method: {method}")
+
+# Shard worker: values start..stop-1 of the sequence
+def _lcg_shard(start, stop, seed, M, C, P):
+    return lcg_array(seed, stop - start, M, C, P, start=start)
+
+# Fill a shared array with `length` values on a process pool; identical to lcg_array(seed, length, ...)
+def parallel_lcg_array(seed, length, M, C, P, workers=None):
+    return fill_array(_lcg_shard, length, np.float64, (seed, M, C, P), workers)
+
+# Upper-tail probability of the chi-square distribution (Wilson-Hilferty approximation)
+def chi_square_p_value(statistic, dof):
+    if dof <= 0:
+        return float("nan")
+    z = ((statistic / dof) ** (1 / 3) - (1 - 2 / (9 * dof))) / sqrt(2 / (9 * dof))
+    return 0.5 * erfc(z / sqrt(2))
+
+def _chi_square(observed, expected):
+    observed = np.asarray(observed, dtype=np.float64)
+    expected = np.asarray(expected, dtype=np.float64)
+    statistic = float(((observed - expected) ** 2 / expected).sum())
+    dof = len(observed) - 1
+    return {"statistic": statistic, "dof": dof, "p_value": chi_square_p_value(statistic, dof)}
+
+# Incremental statistical tests over generator output, fed chunk by chunk.
+# Only fixed-size count arrays and a few carried values are kept, so memory does not grow with the sample count.
+class LCGQualityAnalyzer:
+    def __init__(self, bins=100, serial_bins=32, lattice_bins=16, gap_interval=(0.0, 0.5), max_gap=16):
+        self.bins = bins
+        self.serial_bins = serial_bins
+        self.lattice_bins = lattice_bins
+        self.gap_interval = gap_interval
+        self.max_gap = max_gap
+
+        self.count = 0
+        self.uniform_counts = np.zeros(bins, dtype=np.int64)
+        self.serial_counts = np.zeros(serial_bins ** 2, dtype=np.int64)  # Non-overlapping pairs
+        self.lattice_counts = np.zeros(lattice_bins ** 3, dtype=np.int64)  # Non-overlapping triples
+        self.gap_counts = np.zeros(max_gap + 1, dtype=np.int64)  # Gap lengths 0..max_gap-1 and >= max_gap
+        self.runs = 0  # Runs above/below 0.5
+        self.above = 0
+
+        # State carried across chunk boundaries
+        self._pair_carry = np.empty(0)
+        self._triple_carry = np.empty(0)
+        self._current_gap = None  # None until the first value inside the gap interval
+        self._last_above = None
+
+    @staticmethod
+    def _cells(values, bins):
+        return np.minimum((values * bins).astype(np.int64), bins - 1)
+
+    def update(self, chunk):
+        values = np.asarray(chunk, dtype=np.float64)
+        if len(values) == 0:
+            return self
+        self.count += len(values)
+
+        # Uniformity
+        self.uniform_counts += np.bincount(self._cells(values, self.bins), minlength=self.bins)
+
+        # Serial test on pairs
+        pairs = np.concatenate((self._pair_carry, values))
+        usable = len(pairs) - len(pairs) % 2
+        cells = self._cells(pairs[:usable], self.serial_bins).reshape(-1, 2)
+        self.serial_counts += np.bincount(cells[:, 0] * self.serial_bins + cells[:, 1],
+                                          minlength=self.serial_bins ** 2)
+        self._pair_carry = pairs[usable:]
+
+        # Lattice test on triples
+        triples = np.concatenate((self._triple_carry, values))
+        usable = len(triples) - len(triples) % 3
+        cells = self._cells(triples[:usable], self.lattice_bins).reshape(-1, 3)
+        index = (cells[:, 0] * self.lattice_bins + cells[:, 1]) * self.lattice_bins + cells[:, 2]
+        self.lattice_counts += np.bincount(index, minlength=self.lattice_bins ** 3)
+        self._triple_carry = triples[usable:]
+
+        # Gap test: lengths of runs of values outside [low, high) between values inside it
+        low, high = self.gap_interval
+        hits = np.flatnonzero((values >= low) & (values < high))
+        if len(hits):
+            gaps = np.diff(hits) - 1
+            if self._current_gap is not None:
+                gaps = np.concatenate(([self._current_gap + hits[0]], gaps))
+            self.gap_counts += np.bincount(np.minimum(gaps, self.max_gap), minlength=self.max_gap + 1)
+            self._current_gap = len(values) - hits[-1] - 1
+        elif self._current_gap is not None:
+            self._current_gap += len(values)
+
+        # Runs above/below the median 0.5
+        above = values >= 0.5
+        self.above += int(above.sum())
+        self.runs += int(np.count_nonzero(above[1:] != above[:-1]))
+        self.runs += 1 if self._last_above is None or self._last_above != above[0] else 0
+        self._last_above = bool(above[-1])
+        return self
+
+    def report(self):
+        results = {"count": self.count}
+        if self.count == 0:
+            return results
+        results["uniformity"] = _chi_square(self.uniform_counts, np.full(self.bins, self.count / self.bins))
+        pairs = self.serial_counts.sum()
+        if pairs:
+            cells = self.serial_bins ** 2
+            results["serial_2d"] = _chi_square(self.serial_counts, np.full(cells, pairs / cells))
+        triples = self.lattice_counts.sum()
+        if triples:
+            cells = self.lattice_bins ** 3
+            results["serial_3d"] = _chi_square(self.lattice_counts, np.full(cells, triples / cells))
+
+        gaps = self.gap_counts.sum()
+        if gaps:
+            p = self.gap_interval[1] - self.gap_interval[0]
+            probabilities = [p * (1 - p) ** r for r in range(self.max_gap)] + [(1 - p) ** self.max_gap]
+            results["gap"] = _chi_square(self.gap_counts, gaps * np.array(probabilities))
+
+        # Wald-Wolfowitz runs test
+        n1, n2 = self.above, self.count - self.above
+        if n1 and n2:
+            mean = 2 * n1 * n2 / self.count + 1
+            variance = (mean - 1) * (mean - 2) / (self.count - 1)
+            z = (self.runs - mean) / sqrt(variance) if variance > 0 else 0.0
+            results["runs"] = {"runs": self.runs, "expected": mean, "z": z, "p_value": erfc(abs(z) / sqrt(2))}
+        return results
+
+    # Optional plots drawn from the accumulated counts (no samples are kept)
+    def plot(self):
+        import matplotlib.pyplot as plt  # Loaded on demand, it is the slowest import in the package
+
+        plt.figure()
+        edges = np.linspace(0, 1, self.bins + 1)
+        plt.bar(edges[:-1], self.uniform_counts, width=1 / self.bins, align="edge")
+        plt.title("Distribution of Random Numbers (Histogram)")
+        plt.xlabel("Random Number")
+        plt.ylabel("Frequency")
+        plt.show()
+
+        plt.figure()
+        plt.imshow(self.serial_counts.reshape(self.serial_bins, self.serial_bins).T, origin="lower",
+                   extent=(0, 1, 0, 1), cmap='viridis')
+        plt.title("2D Histogram of Random Numbers")
+        plt.xlabel("X Values")
+        plt.ylabel("Y Values")
+        plt.colorbar(label="Frequency")
+        plt.show()
+
+# Run the test battery over an iterable of chunks (e.g. lcg_chunks(...)) and return the report
+def analyze_stream(chunks, **options):
+    analyzer = LCGQualityAnalyzer(**options)
+    for chunk in chunks:
+        analyzer.update(chunk)
+    return analyzer.report()
+
+if __name__ == "__main__":
+    import matplotlib.pyplot as plt
+
+    # Calculate the cycle length for the given LCG parameters
+    cycle_length = detect_cycle(initial_seed, M, C, P)  # Calculate cycle length
+    print("Cycle length for LCG:", cycle_length)  # Display the cycle length
+
+    # Generate an array of random numbers for visualization
+    random_array_length = 10000  # Desired length for the random array
+    random_array = generate_random_array(initial_seed, random_array_length, M, C, P)  # Generate random numbers
+
+    # Plot a histogram to visualize the distribution of random numbers
+    plt.figure()
+    plt.hist(random_array, bins=50, density=True)  # Histogram with 50 bins
+    plt.title("Distribution of Random Numbers (Histogram)")
+    plt.xlabel("Random Number")
+    plt.ylabel("Frequency")
+    plt.show()
+
+    # Generate x and y coordinates for a 2D histogram
+    x_vals = random_array[0::2]  # Use even indices for x values
+    y_vals = random_array[1::2]  # Use odd indices for y values
+
+    # Create a 2D histogram to visualize relationships between random numbers
+    plt.figure()
+    plt.hist2d(x_vals, y_vals, bins=20, cmap='viridis')  # 20 bins for each axis
+    plt.title("2D Histogram of Random Numbers")
+    plt.xlabel("X Values")
+    plt.ylabel("Y Values")
+    plt.colorbar(label="Frequency")  # Color bar for frequency
+    plt.show()
@@ -0,0 +1,423 @@
+import os
+import struct
+import threading
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice, repeat
+from Crypto.Util.number import getPrime, inverse, GCD
+from Crypto.Random import get_random_bytes
+from Crypto.PublicKey import RSA
+from Crypto.Cipher import PKCS1_OAEP
+from Crypto.Hash import SHA256
+
+# Function to generate RSA keys
+def generate_rsa_keys(key_size=2048):
+    # Generate two large prime numbers
+    p = getPrime(key_size // 2)
+    q = getPrime(key_size // 2)
+
+    # Calculate modulus and totient
+    n = p * q
+    totient = (p - 1) * (q - 1)
+
+    # Choose a public exponent (commonly 65537)
+    e = 65537  # Commonly used for RSA
+
+    # Ensure that e is relatively prime to the totient
+    if GCD(e, totient) != 1:
+        raise ValueError("The public exponent is not relatively prime to the totient.")
+
+    # Calculate the private exponent
+    d = inverse(e, totient)
+
+    # Construct the RSA public and private keys
+    # Passing p, q and qInv (p^-1 mod q) avoids re-factoring n and lets decryption use the CRT
+    public_key = RSA.construct((n, e))
+    private_key = RSA.construct((n, e, d, p, q, inverse(p, q)))
+
+    return public_key, private_key
+
+# Number of PKCS1_OAEP cipher objects kept before the least recently used is dropped
+RSA_CIPHER_CACHE_SIZE = 64
+_cipher_cache = OrderedDict()
+_cipher_cache_lock = threading.Lock()
+
+# Return a cached PKCS1_OAEP (SHA-256) cipher for the key instead of building one per call
+def get_oaep_cipher(key):
+    cache_key = (key.n, key.e, key.has_private())
+    with _cipher_cache_lock:
+        cipher = _cipher_cache.get(cache_key)
+        if cipher is not None:
+            _cipher_cache.move_to_end(cache_key)
+            return cipher
+    cipher = PKCS1_OAEP.new(key, hashAlgo=SHA256)
+    with _cipher_cache_lock:
+        _cipher_cache[cache_key] = cipher
+        if len(_cipher_cache) > RSA_CIPHER_CACHE_SIZE:
+            _cipher_cache.popitem(last=False)
+    return cipher
+
+# Function to encrypt a message with RSA
+def rsa_encrypt(plaintext, public_key):
+    # Use a padding scheme (PKCS1_OAEP) with SHA-256 for secure encryption
+    cipher = get_oaep_cipher(public_key)
+    encrypted = cipher.encrypt(plaintext)
+    return encrypted
+
+# Function to decrypt a message with RSA
+def rsa_decrypt(encrypted, private_key):
+    # Use the corresponding private key to decrypt the message (CRT path when p and q are known)
+    cipher = get_oaep_cipher(private_key)
+    decrypted = cipher.decrypt(encrypted)
+    return decrypted
+
+# Integers that fully describe a key, so it can be sent to worker processes
+def _key_components(key):
+    if key.has_private():
+        return (key.n, key.e, key.d, key.p, key.q, key.u)
+    return (key.n, key.e)
+
+# Keys rebuilt inside a worker process, reused for every chunk that worker handles
+_worker_keys = {}
+
+# Worker: encrypt or decrypt one chunk of messages with a single cached cipher
+def _rsa_chunk(operation, components, messages):
+    key = _worker_keys.get(components)
+    if key is None:
+        key = _worker_keys[components] = RSA.construct(components)
+    cipher = get_oaep_cipher(key)
+    process = cipher.encrypt if operation == "encrypt" else cipher.decrypt
+    return [process(message) for message in messages]
+
+# Split an iterable of messages into lists of chunk_size
+def _chunked(messages, chunk_size):
+    iterator = iter(messages)
+    while True:
+        chunk = list(islice(iterator, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+def _rsa_batch(operation, messages, key, workers, chunk_size):
+    if workers == 1:
+        cipher = get_oaep_cipher(key)
+        process = cipher.encrypt if operation == "encrypt" else cipher.decrypt
+        return [process(message) for message in messages]
+
+    components = _key_components(key)
+    results = []
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        chunks = executor.map(_rsa_chunk, repeat(operation), repeat(components), _chunked(messages, chunk_size))
+        for chunk in chunks:  # map() yields chunks in input order
+            results.extend(chunk)
+    return results
+
+# Encrypt many messages with one public key, spread over a process pool; results keep input order
+def rsa_encrypt_batch(messages, public_key, workers=None, chunk_size=256):
+    return _rsa_batch("encrypt", messages, public_key, workers, chunk_size)
+
+# Decrypt many messages with one private key, spread over a process pool; results keep input order
+def rsa_decrypt_batch(encrypted_messages, private_key, workers=None, chunk_size=256):
+    return _rsa_batch("decrypt", encrypted_messages, private_key, workers, chunk_size)
+
+# Hybrid envelope: RSA-OAEP wraps a random Lab2 session key and IV once, the payload uses a Lab2 stream mode.
+# Layout: magic, version, mode, num_rounds, wrapped key length (2 bytes), wrapped key, payload ciphertext.
+# Only the length-preserving modes are offered, so no padding or payload length has to be stored.
+# Modes name their Lab2 classes so that Lab2 (bitarray, numpy) is imported only when an envelope is used.
+ENVELOPE_MAGIC = b"L4EV"
+ENVELOPE_VERSION = 1
+ENVELOPE_MODES = {"CTR": (1, "CTRCipher", "CTRCipher"), "CFB": (2, "CFBEncryptor", "CFBDecryptor")}
+ENVELOPE_CHUNK_SIZE = 1 << 20
+_ENVELOPE_HEADER = struct.Struct(">4sBBBH")
+
+# Encrypt an iterable of byte chunks; yields the header first, then ciphertext chunks
+def envelope_encrypt_stream(chunks, public_key, mode="CTR", num_rounds=4):
+    from . import Lab2
+
+    if mode not in ENVELOPE_MODES:
+        raise ValueError(f"Unsupported envelope mode: {mode}")
+    mode_id, encryptor_name, _ = ENVELOPE_MODES[mode]
+    encryptor_class = getattr(Lab2, encryptor_name)
+    session_key = get_random_bytes(8)
+    IV = get_random_bytes(8)
+    wrapped_key = rsa_encrypt(session_key + IV, public_key)  # The only RSA operation
+
+    yield _ENVELOPE_HEADER.pack(ENVELOPE_MAGIC, ENVELOPE_VERSION, mode_id, num_rounds, len(wrapped_key)) + wrapped_key
+    encryptor = encryptor_class(Lab2.bytestring_to_bitarray(session_key), Lab2.bytestring_to_bitarray(IV), num_rounds)
+    for chunk in chunks:
+        output = encryptor.update(chunk)
+        if output:
+            yield bytes(output)
+    tail = encryptor.finalize()
+    if tail:
+        yield tail
+
+# Decrypt an iterable of envelope chunks; yields plaintext chunks
+def envelope_decrypt_stream(chunks, private_key):
+    from . import Lab2
+
+    chunks = iter(chunks)
+    buffer = bytearray()
+
+    # Collect enough bytes for the fixed header and the wrapped key
+    def read_exactly(size):
+        while len(buffer) < size:
+            chunk = next(chunks, None)
+            if chunk is None:
+                raise ValueError("Envelope is truncated.")
+            buffer.extend(chunk)
+
+    read_exactly(_ENVELOPE_HEADER.size)
+    magic, version, mode_id, num_rounds, wrapped_length = _ENVELOPE_HEADER.unpack_from(buffer)
+    if magic != ENVELOPE_MAGIC or version != ENVELOPE_VERSION:
+        raise ValueError("Not a supported envelope.")
+    modes = {entry[0]: entry[2] for entry in ENVELOPE_MODES.values()}
+    if mode_id not in modes:
+        raise ValueError(f"Unknown envelope mode id: {mode_id}")
+    read_exactly(_ENVELOPE_HEADER.size + wrapped_length)
+    session = rsa_decrypt(bytes(buffer[_ENVELOPE_HEADER.size:_ENVELOPE_HEADER.size + wrapped_length]), private_key)
+
+    decryptor_class = getattr(Lab2, modes[mode_id])
+    decryptor = decryptor_class(Lab2.bytestring_to_bitarray(session[:8]), Lab2.bytestring_to_bitarray(session[8:]), num_rounds)
+    rest = buffer[_ENVELOPE_HEADER.size + wrapped_length:]
+    if rest:
+        output = decryptor.update(rest)
+        if output:
+            yield bytes(output)
+    for chunk in chunks:
+        output = decryptor.update(chunk)
+        if output:
+            yield bytes(output)
+    tail = decryptor.finalize()
+    if tail:
+        yield tail
+
+# Read a file in fixed-size chunks
+def _read_chunks(path, chunk_size=ENVELOPE_CHUNK_SIZE):
+    with open(path, "rb") as file:
+        while True:
+            chunk = file.read(chunk_size)
+            if not chunk:
+                return
+            yield chunk
+
+def envelope_encrypt_file(input_path, output_path, public_key, mode="CTR", num_rounds=4, chunk_size=ENVELOPE_CHUNK_SIZE):
+    with open(output_path, "wb") as output:
+        for chunk in envelope_encrypt_stream(_read_chunks(input_path, chunk_size), public_key, mode, num_rounds):
+            output.write(chunk)
+
+def envelope_decrypt_file(input_path, output_path, private_key, chunk_size=ENVELOPE_CHUNK_SIZE):
+    with open(output_path, "wb") as output:
+        for chunk in envelope_decrypt_stream(_read_chunks(input_path, chunk_size), private_key):
+            output.write(chunk)
+
+# In-memory helpers for small payloads
+def envelope_encrypt(plaintext, public_key, mode="CTR", num_rounds=4):
+    return b"".join(envelope_encrypt_stream([plaintext], public_key, mode, num_rounds))
+
+def envelope_decrypt(envelope, private_key):
+    return b"".join(envelope_decrypt_stream([envelope], private_key))
+
+# On-disk key store: one file per private key (and its public half), named by key ID.
+# Listing IDs only reads the directory; a key file is parsed the first time it is used and then memoized.
+class RSAKeyStore:
+    extensions = {"PEM": ".pem", "DER": ".der"}
+
+    def __init__(self, directory, format="PEM", passphrase=None):
+        if format not in self.extensions:
+            raise ValueError(f"Unsupported key format: {format}")
+        self.directory = directory
+        self.format = format
+        self.passphrase = passphrase
+        self._private_keys = {}
+        self._public_keys = {}
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+
+    # Key ID: first 16 hex digits of the SHA-256 of the public key in DER form
+    @staticmethod
+    def key_id(key):
+        return SHA256.new(key.public_key().export_key("DER")).hexdigest()[:16]
+
+    def _path(self, key_id, public=False):
+        return os.path.join(self.directory, key_id + (".pub" if public else "") + self.extensions[self.format])
+
+    # Write to a temporary file and rename, so readers never see a partial key
+    @staticmethod
+    def _write(path, data, mode):
+        temp_path = path + ".tmp"
+        with open(os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, mode), "wb") as file:
+            file.write(data)
+        os.replace(temp_path, path)
+
+    def save(self, private_key):
+        key_id = self.key_id(private_key)
+        private_data = private_key.export_key(self.format, passphrase=self.passphrase,
+                                              pkcs=8 if self.passphrase else 1)
+        self._write(self._path(key_id), private_data, 0o600)
+        self._write(self._path(key_id, public=True), private_key.public_key().export_key(self.format), 0o644)
+        with self._lock:
+            self._private_keys[key_id] = private_key
+            self._public_keys[key_id] = private_key.public_key()
+        return key_id
+
+    # Generate a new keypair, persist it and return its ID
+    def generate(self, key_size=2048):
+        _, private_key = generate_rsa_keys(key_size)
+        return self.save(private_key)
+
+    # IDs of every stored key (directory listing only, no key is parsed)
+    def ids(self):
+        suffix = self.extensions[self.format]
+        public_suffix = ".pub" + suffix
+        return sorted(name[:-len(suffix)] for name in os.listdir(self.directory)
+                      if name.endswith(suffix) and not name.endswith(public_suffix))
+
+    def __contains__(self, key_id):
+        return os.path.exists(self._path(key_id))
+
+    def load_private(self, key_id):
+        with self._lock:
+            key = self._private_keys.get(key_id)
+        if key is None:
+            with open(self._path(key_id), "rb") as file:
+                key = RSA.import_key(file.read(), passphrase=self.passphrase)
+            with self._lock:
+                key = self._private_keys.setdefault(key_id, key)
+        return key
+
+    def load_public(self, key_id):
+        with self._lock:
+            key = self._public_keys.get(key_id)
+        if key is None:
+            with open(self._path(key_id, public=True), "rb") as file:
+                key = RSA.import_key(file.read())
+            with self._lock:
+                key = self._public_keys.setdefault(key_id, key)
+        return key
+
+    # (public_key, private_key) for an ID, loaded on first use
+    def load(self, key_id):
+        return self.load_public(key_id), self.load_private(key_id)
+
+    # Reuse the first stored key, or generate one if the store is empty
+    def get_or_generate(self, key_size=2048):
+        ids = self.ids()
+        return ids[0] if ids else self.generate(key_size)
+
+# Worker for the key pool: RSA key objects cannot be pickled, so return the integers and the time spent
+def _generate_key_components(key_size):
+    start = time.perf_counter()
+    _, private_key = generate_rsa_keys(key_size)
+    return _key_components(private_key), time.perf_counter() - start
+
+# Pool of ready-made keypairs, pre-generated in worker processes up to a watermark.
+# get() pops a keypair in O(1) and immediately schedules a replacement in the background.
+class RSAKeyPool:
+    def __init__(self, key_size=2048, watermark=8, workers=None):
+        self.key_size = key_size
+        self.watermark = watermark
+        self._executor = ProcessPoolExecutor(max_workers=workers)
+        self._keys = deque()
+        self._condition = threading.Condition()
+        self._pending = 0  # Keypairs being generated right now
+        self._closed = False
+        self._error = None
+
+        # Statistics
+        self._generated = 0
+        self._handed_out = 0
+        self._misses = 0  # get() calls that had to wait for a keypair
+        self._latencies = deque(maxlen=1000)  # Recent generation times in seconds
+        self._refill()
+
+    # Submit enough generations to bring depth + pending back up to the watermark
+    def _refill(self):
+        with self._condition:
+            missing = self.watermark - len(self._keys) - self._pending
+            if self._closed or missing <= 0:
+                return
+            self._pending += missing
+        for _ in range(missing):
+            self._executor.submit(_generate_key_components, self.key_size).add_done_callback(self._on_generated)
+
+    def _on_generated(self, future):
+        with self._condition:
+            self._pending -= 1
+            try:
+                components, latency = future.result()
+            except Exception as error:  # Keep the error for the next get() instead of losing it in a callback
+                self._error = error
+            else:
+                public_key = RSA.construct(components[:2])
+                private_key = RSA.construct(components)
+                self._keys.append((public_key, private_key))
+                self._generated += 1
+                self._latencies.append(latency)
+            self._condition.notify_all()
+
+    # Return a (public_key, private_key) pair, waiting only if the pool is empty
+    def get(self, timeout=None):
+        with self._condition:
+            if self._closed:
+                raise ValueError("Key pool is closed.")
+            if not self._keys:
+                self._misses += 1
+                self._refill()  # Re-entrant: the condition uses an RLock
+                if not self._condition.wait_for(lambda: self._keys or self._error, timeout):
+                    raise TimeoutError("No RSA keypair became available in time.")
+                if not self._keys:
+                    error, self._error = self._error, None
+                    raise error
+            keypair = self._keys.popleft()
+            self._handed_out += 1
+        self._refill()
+        return keypair
+
+    def stats(self):
+        with self._condition:
+            latencies = list(self._latencies)
+            return {
+                "depth": len(self._keys),
+                "pending": self._pending,
+                "watermark": self.watermark,
+                "generated": self._generated,
+                "handed_out": self._handed_out,
+                "misses": self._misses,
+                "mean_generation_seconds": sum(latencies) / len(latencies) if latencies else None,
+                "max_generation_seconds": max(latencies) if latencies else None,
+                "last_generation_seconds": latencies[-1] if latencies else None,
+            }
+
+    def close(self):
+        with self._condition:
+            self._closed = True
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+if __name__ == "__main__":
+    # Generate RSA public and private keys
+    public_key, private_key = generate_rsa_keys(key_size=2048)
+
+    # Example plaintext message
+    plaintext = b'Hello, RSA!'
+
+    # Encrypt the plaintext message
+    encrypted_message = rsa_encrypt(plaintext, public_key)
+    print("Encrypted message:", encrypted_message)
+
+    # Decrypt the encrypted message
+    decrypted_message = rsa_decrypt(encrypted_message, private_key)
+    print("Decrypted message:", decrypted_message)
+
+    # Validate that the decrypted message matches the original plaintext
+    if decrypted_message == plaintext:
+        print("Decryption successful. The messages match.")
+    else:
+        print("Decryption failed. The messages do not match.")
@@ -0,0 +1,472 @@
+import hashlib
+import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+import numpy as np
+
+# Function to get a list of keys sorted by values from a dictionary
+def get_sorted_array(d):
+    list_d = list(d.items())
+    list_d.sort(key=lambda i: i[1])
+    return [i[0] for i in list_d]
+
+# Largest n-gram table (alphabet_size ** n) counted with a dense bincount; bigger ones use np.unique
+DENSE_NGRAM_LIMIT = 1 << 24
+# Characters encoded at a time by NGramCounts; only one chunk's working arrays are alive at once
+NGRAM_CHUNK_SIZE = 1 << 20
+
+# Letter counts for n = 1..max_n, computed chunk by chunk from an integer-encoded view of the text.
+# Only n-grams made entirely of letters (str.isalpha) are counted, like count_bigrams/count_trigrams.
+class NGramCounts:
+    def __init__(self, text, max_n=3, chunk_size=NGRAM_CHUNK_SIZE):
+        starts = range(0, len(text), chunk_size)
+
+        # First pass: the alphabet is every letter in the text, in code point order
+        present = set()
+        for start in starts:
+            present.update(np.unique(self._codes(text[start:start + chunk_size])).tolist())
+        letters = sorted(code for code in present if chr(code).isalpha())
+        self.alphabet = [chr(code) for code in letters]
+        self.max_n = max_n
+
+        # Letter index per code point, -1 for anything that is not a letter
+        lookup = np.full(max(present) + 1 if present else 1, -1,
+                         dtype=np.int16 if len(letters) < 1 << 15 else np.int32)
+        lookup[letters] = np.arange(len(letters))
+
+        # Second pass: every chunk counts the n-grams that end inside it. The last max_n - 1 letter
+        # indices are carried over, so n-grams spanning a chunk boundary are counted exactly once.
+        size = len(letters)
+        dense = {n: size ** n <= DENSE_NGRAM_LIMIT for n in range(1, max_n + 1)}
+        totals = {}
+        for n in range(1, max_n + 1):
+            if dense[n]:
+                totals[n] = (np.zeros(size ** n, dtype=np.int64), np.full(size ** n, len(text), dtype=np.int64))
+            else:
+                totals[n] = (np.empty(0, dtype=np.int64),) * 3
+        carry = np.full(max_n - 1, -1, dtype=lookup.dtype)
+        for start in starts if size else ():
+            indices = np.concatenate((carry, lookup[self._codes(text[start:start + chunk_size])]))
+            for n in range(1, max_n + 1):
+                ids, positions = self._chunk_ngrams(indices, n, max_n - 1, size)
+                positions += start - n + 1  # Global position of each n-gram's first letter
+                if dense[n]:
+                    counts, first = totals[n]
+                    counts += np.bincount(ids, minlength=size ** n)
+                    np.minimum.at(first, ids, positions)
+                else:
+                    grams, first_index, counts = np.unique(ids, return_index=True, return_counts=True)
+                    totals[n] = self._merge(totals[n], (grams, counts, positions[first_index]))
+            carry = indices[len(indices) - (max_n - 1):]
+
+        self._grams = {}  # n -> (n-gram ids, counts, position of first occurrence)
+        for n in range(1, max_n + 1):
+            if dense[n]:
+                counts, first = totals[n]
+                grams = np.flatnonzero(counts)
+                self._grams[n] = (grams, counts[grams], first[grams])
+            else:
+                self._grams[n] = totals[n]
+
+    @staticmethod
+    def _codes(text):
+        return np.frombuffer(text.encode("utf-32-le"), dtype=np.uint32)
+
+    # Ids (base-size numbers formed by the letter indices) of the all-letter n-grams whose last letter lies
+    # after the first `carried` entries of indices, with their start positions relative to the chunk
+    @staticmethod
+    def _chunk_ngrams(indices, n, carried, size):
+        length = len(indices) - carried
+        base = carried - n + 1
+        valid = np.ones(length, dtype=bool)
+        ids = np.zeros(length, dtype=np.int64)
+        for offset in range(n):
+            window = indices[base + offset:base + offset + length]
+            valid &= window >= 0
+            ids = ids * size + window
+        return ids[valid], np.flatnonzero(valid)
+
+    # Combine two sparse (ids, counts, first positions) tables
+    @staticmethod
+    def _merge(left, right):
+        ids, inverse = np.unique(np.concatenate((left[0], right[0])), return_inverse=True)
+        counts = np.zeros(len(ids), dtype=np.int64)
+        np.add.at(counts, inverse, np.concatenate((left[1], right[1])))
+        first = np.full(len(ids), np.iinfo(np.int64).max, dtype=np.int64)
+        np.minimum.at(first, inverse, np.concatenate((left[2], right[2])))
+        return ids, counts, first
+
+    def _decode(self, gram, n):
+        letters = []
+        for _ in range(n):
+            gram, index = divmod(gram, len(self.alphabet))
+            letters.append(self.alphabet[index])
+        return "".join(reversed(letters))
+
+    # The k most frequent n-grams via partial selection. Ties are ordered like
+    # reversed(get_sorted_array(...)): the n-gram that first appeared later comes first.
+    def top(self, n, k):
+        grams, counts, first = self._grams[n]
+        if k <= 0 or len(counts) == 0:
+            return []
+        if k < len(counts):
+            threshold = np.partition(counts, len(counts) - k)[len(counts) - k]
+            candidates = np.flatnonzero(counts >= threshold)
+        else:
+            candidates = np.arange(len(counts))
+        order = candidates[np.lexsort((-first[candidates], -counts[candidates]))][:k]
+        return [self._decode(int(grams[i]), n) for i in order]
+
+    # {n-gram: count} in order of first occurrence, like the dictionaries built by the loops
+    def as_dict(self, n):
+        grams, counts, first = self._grams[n]
+        order = np.argsort(first, kind="stable")
+        return {self._decode(int(grams[i]), n): int(counts[i]) for i in order}
+
+# Function to count unigrams through max_n-grams of a text in a single pass
+def count_ngrams(text, max_n=3):
+    return NGramCounts(text, max_n)
+
+# Function to count bigrams in a given text and return the most common ones
+def count_bigrams(text):
+    return count_ngrams(text, 2).top(2, 11)  # Return the top 11 bigrams
+
+# Function to count trigrams in a given text and return the most common ones
+def count_trigrams(text):
+    return count_ngrams(text, 3).top(3, 6)  # Return the top 6 trigrams
+
+# Compile a character mapping into a str.translate table once, so it can be applied in bulk
+def compile_mapping(char_mapping):
+    return str.maketrans(char_mapping)
+
+# Compile an ASCII-only mapping into a 256-byte table for bytes.translate, or None if it is not ASCII-only.
+# UTF-8 never uses ASCII byte values inside multi-byte characters, so the table is safe on UTF-8 data.
+def compile_byte_table(char_mapping):
+    if not all(ord(key) < 128 and ord(value) < 128 for key, value in char_mapping.items()):
+        return None
+    table = bytearray(range(256))
+    for key, value in char_mapping.items():
+        table[ord(key)] = ord(value)
+    return bytes(table)
+
+# Function to decode one text with a compiled table
+def decode_text(text, table):
+    return text.translate(table)
+
+# Function to decode many documents with the same compiled table
+def decode_batch(texts, char_mapping):
+    table = compile_mapping(char_mapping)
+    return [text.translate(table) for text in texts]
+
+# Function to decode a file of any size chunk by chunk (bytes.translate for ASCII-only mappings)
+def decode_file(input_path, output_path, char_mapping, chunk_size=1 << 22, encoding="utf-8"):
+    byte_table = compile_byte_table(char_mapping) if encoding.lower().replace("_", "-") in ("utf-8", "ascii") else None
+    if byte_table is not None:
+        with open(input_path, "rb") as source, open(output_path, "wb") as target:
+            for chunk in iter(lambda: source.read(chunk_size), b""):
+                target.write(chunk.translate(byte_table))
+        return
+
+    table = compile_mapping(char_mapping)
+    # newline="" keeps \r\n and \r as they are, matching the byte path
+    with open(input_path, encoding=encoding, newline="") as source, open(output_path, "w", encoding=encoding, newline="") as target:
+        for chunk in iter(lambda: source.read(chunk_size), ""):
+            target.write(chunk.translate(table))
+
+# Function to decrypt a text based on letter frequency and manual mappings
+def decrypt(text, expected_letter_freq):
+    # Count the frequency of letters in the given text
+    current_letter_freq = count_ngrams(text, 1).as_dict(1)
+
+    # Convert counts to percentages
+    total_letters = sum(current_letter_freq.values())
+    for char in current_letter_freq:
+        current_letter_freq[char] = (current_letter_freq[char] * 100) / total_letters
+
+    # Get sorted arrays for expected and actual frequencies
+    expected_order = list(reversed(get_sorted_array(expected_letter_freq)))
+    actual_order = list(reversed(get_sorted_array(current_letter_freq)))
+
+    # Create a mapping of characters from the actual text to the expected order
+    char_mapping = {actual_order[i]: expected_order[i] for i in range(len(actual_order))}
+
+    # Decrypt the text using the mapping (non-alphabetic characters remain unchanged)
+    result_text = decode_text(text, compile_mapping(char_mapping))
+
+    return result_text, char_mapping, current_letter_freq  # Return the decrypted text, mapping, and letter frequency
+
+# Letters modelled by the corpus-derived language model
+MODEL_ALPHABET = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+MODEL_FORMAT_VERSION = 1
+# Per-user cache, so an installed (read-only) package never writes next to its sources.
+# IB_TASK_CACHE_DIR overrides it; otherwise $XDG_CACHE_HOME/ib_task or ~/.cache/ib_task is used.
+MODEL_CACHE_DIR = os.path.join(
+    os.environ.get("IB_TASK_CACHE_DIR")
+    or os.path.join(os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache"), "ib_task"),
+    "lab5_models")
+DEFAULT_CORPORA = (os.path.join(os.path.dirname(os.path.abspath(__file__)), "eng_text"),)
+MODEL_TABLES = ("letter", "bigram", "trigram")
+
+# Letter, bigram and trigram log-probability tables indexed by MODEL_ALPHABET position.
+# Tables are stored as float32 .npy files and memory-mapped when loaded from the cache.
+class LanguageModel:
+    def __init__(self, letter, bigram, trigram, alphabet=MODEL_ALPHABET):
+        self.alphabet = alphabet
+        self.letter = letter  # log P(a), shape (26,)
+        self.bigram = bigram  # log P(ab), shape (26, 26)
+        self.trigram = trigram  # log P(abc), shape (26, 26, 26)
+
+    # Stream corpus files chunk by chunk and build smoothed log-probability tables
+    @classmethod
+    def build(cls, paths, alphabet=MODEL_ALPHABET, smoothing=0.5, chunk_size=1 << 20):
+        size = len(alphabet)
+        lookup = np.full(129, -1, dtype=np.int64)  # ASCII code -> letter index; 128 catches everything else
+        for index, char in enumerate(alphabet):
+            lookup[ord(char)] = index
+        counts = [np.zeros(size ** n, dtype=np.int64) for n in (1, 2, 3)]
+
+        for path in paths:
+            carry = np.full(2, -1, dtype=np.int64)  # Last two letter indices of the previous chunk
+            with open(path, encoding="utf-8", errors="replace") as file:
+                while True:
+                    text = file.read(chunk_size)
+                    if not text:
+                        break
+                    codes = np.frombuffer(text.upper().encode("utf-32-le"), dtype=np.uint32)
+                    indices = np.concatenate((carry, lookup[np.minimum(codes, 128)]))
+                    for n in (1, 2, 3):
+                        # Every n-gram that ends inside this chunk
+                        length = len(indices) - 2
+                        valid = np.ones(length, dtype=bool)
+                        ids = np.zeros(length, dtype=np.int64)
+                        for offset in range(2 - (n - 1), 3):
+                            window = indices[offset:offset + length]
+                            valid &= window >= 0
+                            ids = ids * size + window
+                        counts[n - 1] += np.bincount(ids[valid], minlength=size ** n)
+                    carry = indices[-2:]
+
+        tables = []
+        for n, table in zip((1, 2, 3), counts):
+            probabilities = (table + smoothing) / (table.sum() + smoothing * size ** n)
+            tables.append(np.log(probabilities).astype(np.float32).reshape((size,) * n))
+        return cls(*tables, alphabet=alphabet)
+
+    # Each table is written to a temporary file and renamed, so a crash never leaves a partial table behind
+    def save(self, directory):
+        os.makedirs(directory, exist_ok=True)
+        for name in MODEL_TABLES:
+            path = os.path.join(directory, name + ".npy")
+            temp_path = f"{path}.{os.getpid()}.tmp"
+            try:
+                with open(temp_path, "wb") as file:
+                    np.save(file, getattr(self, name))
+                os.replace(temp_path, path)
+            except BaseException:
+                if os.path.exists(temp_path):
+                    os.remove(temp_path)
+                raise
+
+    @classmethod
+    def load(cls, directory, alphabet=MODEL_ALPHABET):
+        tables = [np.load(os.path.join(directory, name + ".npy"), mmap_mode="r") for name in MODEL_TABLES]
+        return cls(*tables, alphabet=alphabet)
+
+    # Letter frequencies in percent, in the same form as english_letter_freq (most frequent first)
+    def letter_frequencies(self):
+        percentages = np.exp(np.asarray(self.letter, dtype=np.float64)) * 100
+        order = np.argsort(-percentages, kind="stable")
+        return {self.alphabet[i]: float(percentages[i]) for i in order}
+
+# Hash of the corpus contents and model settings, used as the cache key
+def corpus_hash(paths, alphabet=MODEL_ALPHABET, smoothing=0.5):
+    digest = hashlib.sha256(f"{MODEL_FORMAT_VERSION}:{alphabet}:{smoothing}".encode())
+    for path in paths:
+        with open(path, "rb") as file:
+            for block in iter(lambda: file.read(1 << 20), b""):
+                digest.update(block)
+        digest.update(b"\0")  # Separate files so concatenation changes the hash
+    return digest.hexdigest()
+
+# Load the model for the given corpora from the cache, building and saving it only when the corpus changed
+def load_language_model(paths=DEFAULT_CORPORA, cache_dir=MODEL_CACHE_DIR, alphabet=MODEL_ALPHABET, smoothing=0.5):
+    directory = os.path.join(cache_dir, corpus_hash(paths, alphabet, smoothing))
+    if not all(os.path.exists(os.path.join(directory, name + ".npy")) for name in MODEL_TABLES):
+        model = LanguageModel.build(paths, alphabet, smoothing)
+        try:
+            model.save(directory)
+        except OSError:
+            return model  # Cache not writable: use the model from memory
+    return LanguageModel.load(directory, alphabet)
+
+# N-grams of one order present in a ciphertext: letter indices, counts, and which entries involve each letter
+class _SparseNgrams:
+    def __init__(self, indices, n, size):
+        length = len(indices) - n + 1
+        if length <= 0:
+            self.letters = np.empty((0, n), dtype=np.int64)
+            self.counts = np.empty(0)
+        else:
+            windows = np.stack([indices[offset:offset + length] for offset in range(n)], axis=1)
+            windows = windows[(windows >= 0).all(axis=1)]
+            self.letters, counts = np.unique(windows, axis=0, return_counts=True)
+            self.counts = counts.astype(np.float64)
+        self.n = n
+        self.size = size
+        self.involves = np.stack([(self.letters == letter).any(axis=1) for letter in range(size)])
+
+    # Table index of every n-gram after decoding with key (cipher letter index -> plain letter index)
+    def table_ids(self, key, entries=slice(None)):
+        ids = np.zeros(len(self.counts[entries]), dtype=np.int64)
+        for column in range(self.n):
+            ids = ids * self.size + key[self.letters[entries, column]]
+        return ids
+
+# Substitution-cipher solver: hill-climbs over letter swaps, scoring keys with the language model.
+# Each swap only re-scores the cipher n-grams that contain one of the two swapped letters.
+class SubstitutionSolver:
+    def __init__(self, ciphertext, model=None, weights=(1.0, 1.0, 1.0)):
+        model = model or load_language_model()
+        self.alphabet = model.alphabet
+        self.ciphertext = ciphertext
+        size = len(self.alphabet)
+
+        lookup = np.full(129, -1, dtype=np.int64)
+        for index, char in enumerate(self.alphabet):
+            lookup[ord(char)] = index
+        codes = np.frombuffer(ciphertext.upper().encode("utf-32-le"), dtype=np.uint32)
+        indices = lookup[np.minimum(codes, 128)]
+
+        self.ngrams = [_SparseNgrams(indices, n, size) for n in (1, 2, 3)]
+        tables = (model.letter, model.bigram, model.trigram)
+        self.tables = [weight * np.asarray(table, dtype=np.float64).ravel() for weight, table in zip(weights, tables)]
+        self.letter_counts = np.zeros(size)
+        self.letter_counts[self.ngrams[0].letters[:, 0]] = self.ngrams[0].counts
+        self.model_order = np.argsort(-np.asarray(model.letter), kind="stable")
+
+    def score(self, key):
+        return sum(float(grams.counts @ table[grams.table_ids(key)]) for grams, table in zip(self.ngrams, self.tables))
+
+    # Score change from swapping the plain letters assigned to cipher letters a and b
+    def _swap_delta(self, key, swapped, a, b):
+        delta = 0.0
+        for grams, table in zip(self.ngrams, self.tables):
+            entries = np.flatnonzero(grams.involves[a] | grams.involves[b])
+            if len(entries):
+                counts = grams.counts[entries]
+                delta += float(counts @ (table[grams.table_ids(swapped, entries)] - table[grams.table_ids(key, entries)]))
+        return delta
+
+    # Key that maps cipher letters to model letters by frequency rank, like decrypt()
+    def frequency_key(self):
+        cipher_order = np.argsort(-self.letter_counts, kind="stable")
+        key = np.empty(len(self.alphabet), dtype=np.int64)
+        key[cipher_order] = self.model_order
+        return key
+
+    # One hill climb: keep applying improving swaps until a full pass over all pairs finds none
+    def climb(self, seed, initial_key=None):
+        rng = np.random.default_rng(seed)
+        size = len(self.alphabet)
+        key = rng.permutation(size) if initial_key is None else np.array(initial_key, dtype=np.int64)
+        score = self.score(key)
+        present = np.flatnonzero(self.letter_counts)
+        pairs = [(a, b) for a in present for b in range(size) if b != a and (b not in present or b > a)]
+
+        improved = True
+        while improved:
+            improved = False
+            for pair in rng.permutation(len(pairs)):
+                a, b = pairs[pair]
+                swapped = key.copy()
+                swapped[a], swapped[b] = key[b], key[a]
+                delta = self._swap_delta(key, swapped, a, b)
+                if delta > 1e-9:
+                    key, score, improved = swapped, score + delta, True
+        return score, key
+
+    # Best of several restarts, run on a process pool; restart 0 starts from the frequency-rank key
+    def solve(self, restarts=8, workers=None, seed=0):
+        seeds = [seed + restart for restart in range(restarts)]
+        initial_keys = [self.frequency_key()] + [None] * (restarts - 1)
+        if workers == 1 or restarts == 1:
+            results = [self.climb(s, k) for s, k in zip(seeds, initial_keys)]
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(_climb_restart, repeat(self), seeds, initial_keys))
+        score, key = max(results, key=lambda result: result[0])
+        char_mapping = {self.alphabet[cipher]: self.alphabet[plain] for cipher, plain in enumerate(key)
+                        if self.letter_counts[cipher]}
+        return self.decode(char_mapping), char_mapping, score
+
+    # Apply an uppercase letter mapping to the ciphertext, keeping the case of each letter
+    def decode(self, char_mapping):
+        full_mapping = dict(char_mapping)
+        full_mapping.update({cipher.lower(): plain.lower() for cipher, plain in char_mapping.items()})
+        return decode_text(self.ciphertext, compile_mapping(full_mapping))
+
+# Process-pool entry point for one restart
+def _climb_restart(solver, seed, initial_key):
+    return solver.climb(seed, initial_key)
+
+# Function to visualize results and show key decryption mappings
+def show_result(decrypted_text, expected_letter_freq, current_letter_freq, char_mapping):
+    import matplotlib.pyplot as plt  # Only the visualization needs matplotlib
+
+    print('Decrypted Text:')
+    print(decrypted_text)
+
+    # Visualize expected letter frequencies
+    plt.bar(expected_letter_freq.keys(), expected_letter_freq.values(), width=0.5, color='g')
+    plt.show()
+
+    # Visualize actual letter frequencies after decryption
+    current_sorted = get_sorted_array(current_letter_freq)
+    plt.bar(current_sorted, [current_letter_freq[c] for c in current_sorted], width=0.5, color='b')
+    plt.show()
+
+    # Print the mapping used for decryption
+    print('Character Mapping:')
+    for key, value in char_mapping.items():
+        print(f"{key} -> {value}")
+
+# Test case with simple text and predefined frequencies
+english_letter_freq = {
+    'E': 12.70,
+    'T': 9.06,
+    'A': 8.17,
+    'O': 7.51,
+    'I': 6.97,
+    'N': 6.75,
+    'S': 6.33,
+    'H': 6.09,
+    'R': 5.99,
+    'D': 4.25,
+    'L': 4.03,
+    'C': 2.78,
+    'U': 2.76,
+    'M': 2.41,
+    'W': 2.36,
+    'F': 2.23,
+    'G': 2.02,
+    'Y': 1.97,
+    'P': 1.93,
+    'B': 1.29,
+    'V': 0.98,
+    'K': 0.77,
+    'J': 0.15,
+    'X': 0.15,
+    'Q': 0.10,
+    'Z': 0.07
+}
+
+if __name__ == "__main__":
+    # Read text data from files
+    rus_text = "example text for decryption"
+    eng_text = "example english text to lower case"
+
+    # Decrypt the Russian text with a given letter frequency
+    decrypted_text, char_mapping, current_letter_freq = decrypt(rus_text, english_letter_freq)
+
+    # Show the result
+    show_result(decrypted_text, english_letter_freq, current_letter_freq, char_mapping)
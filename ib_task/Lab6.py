@@ -0,0 +1,388 @@
+# Import the necessary library for image processing
+import hashlib
+import os
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+import struct
+import zlib
+import numpy as np
+from PIL import Image
+
+# Function to hide a secret message within an image
+def hide_message(container_image_path, message, output_path):
+    # Open the container image where the message will be hidden
+    container_image = Image.open(container_image_path)
+
+    # Convert the message into binary bits
+    # Each character is converted to its ASCII binary representation (8 bits)
+    message_bits = ''.join(format(ord(char), '08b') for char in message)
+
+    # Append a termination marker to indicate the end of the message
+    message_bits += "00000000"
+
+    # Get the pixel data from the container image
+    container_pixels = list(container_image.getdata())
+    new_pixels = []  # To store modified pixel data
+    message_index = 0  # Tracks the position in the message_bits
+    message_length = len(message_bits)  # Total number of bits in the message
+
+    # Embed the message bits into the least significant bit of the red channel
+    for pixel in container_pixels:
+        r, g, b = pixel  # Extract RGB values from the pixel
+
+        if message_index < message_length:
+            # Clear the least significant bit of the red channel
+            r &= 0xFE  # Set the last bit to 0
+            # Set the least significant bit to the corresponding message bit
+            r |= int(message_bits[message_index])  # 1 or 0 based on the message
+            message_index += 1  # Move to the next bit
+
+        # Append the modified pixel to the new pixel list
+        new_pixels.append((r, g, b))
+
+    # Create a new image with the modified pixel data
+    new_image = Image.new(container_image.mode, container_image.size)  # Same mode and size
+    new_image.putdata(new_pixels)  # Apply modified pixel data
+    new_image.save(output_path)  # Save the new image with the hidden message
+
+# Function to extract the hidden message from an image
+def extract_message(container_image_path):
+    # Open the container image from which the message will be extracted
+    container_image = Image.open(container_image_path)
+    container_pixels = list(container_image.getdata())  # Get the pixel data
+
+    message_bits = ''  # To store the extracted bits
+    # Extract the least significant bit of the red channel from each pixel
+    for pixel in container_pixels:
+        r, _, _ = pixel  # Only interested in the red channel
+        message_bits += str(r & 1)  # Get the LSB of the red channel
+
+    # Find the index of the termination marker ("00000000")
+    end_index = message_bits.find("00000000")
+    if end_index == -1:
+        return "Termination marker not found. Message extraction unsuccessful."  # No marker found
+
+    # Extract only the message bits before the termination marker
+    message_bits = message_bits[:end_index]
+
+    # Convert the binary bits back into characters to reconstruct the hidden message
+    decoded_message = ""  # Holds the decoded message
+    for i in range(0, len(message_bits), 8):  # Process 8 bits at a time
+        byte = message_bits[i:i + 8]  # Get a byte (8 bits)
+        decoded_message += chr(int(byte, 2))  # Convert the byte to an ASCII character
+
+    return decoded_message  # Return the decoded message
+
+# Vectorized hide_message: the image is a NumPy array and the message is written with one masked operation
+def hide_message_numpy(container_image_path, message, output_path):
+    with Image.open(container_image_path) as container_image:
+        mode = container_image.mode
+        pixels = np.array(container_image)  # Shape (height, width, channels)
+    if pixels.ndim != 3:
+        raise ValueError("The container image must have a red channel (e.g. RGB).")
+
+    # Same bits as hide_message: 8 bits per character followed by the "00000000" terminator
+    try:
+        message_bytes = message.encode("latin-1")
+    except UnicodeEncodeError:
+        raise ValueError("Only characters up to U+00FF fit in 8 bits per character.")
+    message_bits = np.unpackbits(np.frombuffer(message_bytes + b"\x00", dtype=np.uint8))
+
+    _embed_red_lsb(pixels, message_bits)
+    Image.fromarray(pixels, mode).save(output_path)
+
+# Write bits into the least significant bit of the red channel, in pixel order
+def _embed_red_lsb(pixels, bits):
+    flat_pixels = pixels.reshape(-1, pixels.shape[2])  # One row per pixel, a view into `pixels`
+    if len(bits) > len(flat_pixels):
+        raise ValueError("The message does not fit in the container image.")
+
+    # Clear the least significant bit of the red channel and set it to the message bit
+    red = flat_pixels[:len(bits), 0]
+    flat_pixels[:len(bits), 0] = (red & 0xFE) | bits
+
+# Vectorized extract_message: LSB plane of the red channel, terminator search and np.packbits decoding
+def extract_message_numpy(container_image_path):
+    with Image.open(container_image_path) as container_image:
+        pixels = np.asarray(container_image)
+    message_bits = pixels.reshape(-1, pixels.shape[2])[:, 0] & 1
+
+    # Find the first run of 8 zero bits (the termination marker), at any bit offset like extract_message
+    ones_so_far = np.concatenate(([0], np.cumsum(message_bits, dtype=np.int64)))
+    window_sums = ones_so_far[8:] - ones_so_far[:-8]
+    markers = np.flatnonzero(window_sums == 0)
+    if len(markers) == 0:
+        return "Termination marker not found. Message extraction unsuccessful."  # No marker found
+    message_bits = message_bits[:markers[0]]
+
+    # Whole bytes via packbits; a trailing partial group is read as a smaller number, as extract_message does
+    whole = len(message_bits) - len(message_bits) % 8
+    decoded_message = np.packbits(message_bits[:whole]).tobytes().decode("latin-1")
+    if whole < len(message_bits):
+        decoded_message += chr(int("".join(map(str, message_bits[whole:])), 2))
+    return decoded_message
+
+# Versioned payload format. The header is always stored in the red-channel LSBs of the first pixels;
+# the payload follows in the mode the header describes. The length lets extraction stop right after
+# the payload instead of scanning the whole image for a terminator.
+#   version 1: magic, version, flags, length, CRC-32; payload continues 1 bit per pixel in the red channel
+#   version 2: magic, version, flags, bits per channel, channel mask, length, CRC-32; payload starts
+#              after the header pixels and uses the k lowest bits of every selected channel
+STEGO_MAGIC = b"SG"
+STEGO_VERSION = 2
+STEGO_FLAG_TEXT = 1  # Payload is UTF-8 text (otherwise raw bytes)
+STEGO_FLAG_KEYED = 2  # Payload pixels are visited in a key-derived permuted order
+STEGO_CHANNELS = "RGBA"  # Bit i of the channel mask selects STEGO_CHANNELS[i]
+_STEGO_HEADER_V1 = struct.Struct(">2sBBII")
+_STEGO_HEADER = struct.Struct(">2sBBBBII")
+STEGO_HEADER_PIXELS = _STEGO_HEADER.size * 8
+# Output formats that keep every pixel value exactly (lossy formats such as JPEG destroy the payload)
+LOSSLESS_EXTENSIONS = (".png", ".bmp", ".tif", ".tiff", ".ppm")
+
+# Decode the rows holding the first `pixel_count` pixels; returns (pixels, (width, height), bands).
+# Non-interlaced PNGs are decoded row by row, so shrinking the decoder's tile stops it early. That relies
+# on Pillow internals, so any failure falls back to a full decode and crop from a fresh handle, which is
+# also how other formats are read.
+def _load_rows(container_image_path, pixel_count):
+    with Image.open(container_image_path) as image:
+        width, height = image.size
+        info = (width, height), image.getbands()
+        box = (0, 0, width, min(-(-pixel_count // width), height))
+        tile = image.tile[0] if len(image.tile) == 1 else None
+        if image.format != "PNG" or tile is None or tile[0] != "zip" or image.info.get("interlace"):
+            return np.asarray(image.crop(box)), *info
+        try:
+            image.tile = [tile._replace(extents=box) if hasattr(tile, "_replace") else (tile[0], box) + tuple(tile[2:])]
+            image._size = box[2:]
+            image.load()
+            pixels = np.asarray(image)
+            if pixels.shape[:2] == (box[3], width):  # np.asarray swallows some errors into an object array
+                return pixels, *info
+        except Exception:
+            pass
+    with Image.open(container_image_path) as image:
+        return np.asarray(image.crop(box)), *info
+
+# Channel letters -> (channel mask, column index of each channel in the pixel array)
+def _select_channels(channels, bands):
+    mask = 0
+    indices = []
+    for letter in channels.upper():
+        if letter not in STEGO_CHANNELS or letter not in bands:
+            raise ValueError(f"Channel {letter!r} is not available in an image with bands {bands}.")
+        if mask & (1 << STEGO_CHANNELS.index(letter)):
+            raise ValueError(f"Channel {letter!r} is listed twice.")
+        mask |= 1 << STEGO_CHANNELS.index(letter)
+    for position, letter in enumerate(STEGO_CHANNELS):
+        if mask & (1 << position):
+            indices.append(bands.index(letter))
+    return mask, np.array(indices, dtype=np.int64)
+
+def _channels_from_mask(mask):
+    return "".join(letter for position, letter in enumerate(STEGO_CHANNELS) if mask & (1 << position))
+
+# Order in which payload pixels are visited: sequential, or a permutation seeded from the key
+def _pixel_order(total_pixels, count, key):
+    if key is None:
+        return np.arange(STEGO_HEADER_PIXELS, STEGO_HEADER_PIXELS + count)
+    if isinstance(key, str):
+        key = key.encode("utf-8")
+    seed = int.from_bytes(hashlib.sha256(key).digest()[:8], "big")
+    order = np.random.default_rng(seed).permutation(total_pixels - STEGO_HEADER_PIXELS)[:count]
+    return order + STEGO_HEADER_PIXELS
+
+# Carriers without RGB bands (palette GIFs, grayscale, CMYK, ...) are embedded into after conversion;
+# RGBA is used when the source has an alpha channel or palette transparency
+def _carrier_mode(image):
+    if image.mode in ("RGB", "RGBA"):
+        return image.mode
+    return "RGBA" if "A" in image.getbands() or "transparency" in image.info else "RGB"
+
+# Number of payload bytes an image can hold in the given mode (header pixels excluded)
+def payload_capacity(container_image_path, bits_per_channel=1, channels="R"):
+    with Image.open(container_image_path) as image:
+        _, channel_indices = _select_channels(channels, tuple(_carrier_mode(image)))
+        payload_pixels = max(0, image.size[0] * image.size[1] - STEGO_HEADER_PIXELS)
+    return payload_pixels * len(channel_indices) * bits_per_channel // 8
+
+# Hide text (stored as UTF-8) or bytes behind a versioned, checksummed header.
+# bits_per_channel (1-8) low bits of each channel in `channels` ("R", "RGB", "RGBA", ...) carry data,
+# and a key permutes the order of the payload pixels.
+def hide_payload(container_image_path, payload, output_path, bits_per_channel=1, channels="R", key=None):
+    if not 1 <= bits_per_channel <= 8:
+        raise ValueError("bits_per_channel must be between 1 and 8.")
+    extension = os.path.splitext(os.fspath(output_path))[1].lower()
+    if extension not in LOSSLESS_EXTENSIONS:
+        raise ValueError(f"The output image must use a lossless format ({', '.join(LOSSLESS_EXTENSIONS)}), "
+                         f"not {extension or 'no extension'}.")
+    flags = STEGO_FLAG_KEYED if key is not None else 0
+    if isinstance(payload, str):
+        payload = payload.encode("utf-8")
+        flags |= STEGO_FLAG_TEXT
+    payload = bytes(payload)
+
+    with Image.open(container_image_path) as container_image:
+        mode = _carrier_mode(container_image)
+        channel_mask, channel_indices = _select_channels(channels, tuple(mode))
+        pixels = np.array(container_image if container_image.mode == mode else container_image.convert(mode))
+    flat_pixels = pixels.reshape(-1, pixels.shape[2])
+
+    capacity = max(0, len(flat_pixels) - STEGO_HEADER_PIXELS) * len(channel_indices) * bits_per_channel // 8
+    if len(payload) > capacity:
+        raise ValueError(f"The payload ({len(payload)} bytes) exceeds the image capacity ({capacity} bytes).")
+
+    header = _STEGO_HEADER.pack(STEGO_MAGIC, STEGO_VERSION, flags, bits_per_channel, channel_mask,
+                                len(payload), zlib.crc32(payload))
+    _embed_red_lsb(pixels, np.unpackbits(np.frombuffer(header, dtype=np.uint8)))
+
+    # Group the payload bits into k-bit values, one per selected channel slot
+    bits = np.unpackbits(np.frombuffer(payload, dtype=np.uint8))
+    bits = np.concatenate((bits, np.zeros(-len(bits) % bits_per_channel, dtype=np.uint8)))
+    weights = (1 << np.arange(bits_per_channel - 1, -1, -1)).astype(np.uint8)
+    values = (bits.reshape(-1, bits_per_channel) * weights).sum(axis=1).astype(np.uint8)
+
+    pixel_count = -(-len(values) // len(channel_indices))
+    rows = _pixel_order(len(flat_pixels), pixel_count, key)[:, None]
+    slots = flat_pixels[rows, channel_indices].ravel()
+    clear_mask = np.uint8(0xFF ^ ((1 << bits_per_channel) - 1))
+    slots[:len(values)] = (slots[:len(values)] & clear_mask) | values
+    flat_pixels[rows, channel_indices] = slots.reshape(-1, len(channel_indices))
+
+    Image.fromarray(pixels, mode).save(output_path)
+
+# Extract a payload written by hide_payload. The header pixels are decoded once and the version picks
+# the layout; the image is decoded a second time only if the payload reaches past the rows already read
+# (keyed payloads are spread over the whole image, so the whole image is decoded for them).
+def extract_payload(container_image_path, key=None):
+    pixels, (width, height), bands = _load_rows(container_image_path, STEGO_HEADER_PIXELS)
+    if pixels.ndim != 3:
+        raise ValueError("The container image must have a red channel (e.g. RGB).")
+    header = np.packbits(pixels.reshape(-1, pixels.shape[2])[:STEGO_HEADER_PIXELS, 0] & 1).tobytes()
+    if len(header) < _STEGO_HEADER_V1.size or header[:2] != STEGO_MAGIC:
+        raise ValueError("No hidden payload found (bad magic).")
+    version = header[2]
+
+    if version == 1:
+        _, _, flags, length, checksum = _STEGO_HEADER_V1.unpack_from(header)
+        header_pixels = _STEGO_HEADER_V1.size * 8
+        if header_pixels + length * 8 > width * height:
+            raise ValueError("Payload length in the header exceeds the image capacity.")
+        bits_per_channel, channel_indices, group_count = 1, [0], length * 8
+        order = np.arange(header_pixels, header_pixels + length * 8)  # One red-channel bit per pixel
+    elif version == STEGO_VERSION:
+        if len(header) < _STEGO_HEADER.size:
+            raise ValueError("The image is too small to hold a payload header.")
+        _, _, flags, bits_per_channel, channel_mask, length, checksum = _STEGO_HEADER.unpack(header)
+        if flags & STEGO_FLAG_KEYED and key is None:
+            raise ValueError("This payload was hidden with a key; pass key= to extract it.")
+        if not 1 <= bits_per_channel <= 8:
+            raise ValueError("Corrupt header: invalid bits per channel.")
+        _, channel_indices = _select_channels(_channels_from_mask(channel_mask), bands)
+        capacity = max(0, width * height - STEGO_HEADER_PIXELS) * len(channel_indices) * bits_per_channel // 8
+        if length > capacity:
+            raise ValueError("Payload length in the header exceeds the image capacity.")
+        group_count = -(-length * 8 // bits_per_channel)
+        pixel_count = -(-group_count // len(channel_indices))
+        order = _pixel_order(width * height, pixel_count, key if flags & STEGO_FLAG_KEYED else None)
+    else:
+        raise ValueError(f"Unsupported payload version: {version}")
+
+    needed = int(order.max()) + 1 if len(order) else 0
+    if needed > pixels.shape[0] * pixels.shape[1]:
+        pixels, _, _ = _load_rows(container_image_path, needed)
+    flat_pixels = pixels.reshape(-1, pixels.shape[2])
+
+    values = flat_pixels[order[:, None], channel_indices].ravel()[:group_count]
+    shifts = np.arange(bits_per_channel - 1, -1, -1, dtype=np.uint8)
+    bits = ((values[:, None] >> shifts) & 1).astype(np.uint8).ravel()[:length * 8]
+    payload = np.packbits(bits).tobytes()
+
+    if zlib.crc32(payload) != checksum:
+        raise ValueError("Payload checksum mismatch.")
+    return payload.decode("utf-8") if flags & STEGO_FLAG_TEXT else payload
+
+# Batch pipeline: embed into or extract from many carriers on a process pool.
+# Each worker opens, decodes and writes its own image; results come back in input order with timings.
+IMAGE_EXTENSIONS = (".png", ".bmp", ".tif", ".tiff", ".jpg", ".jpeg", ".webp", ".gif", ".ppm")
+
+# Image paths from a directory (sorted by name) or a manifest file with one path per line
+def scan_images(source):
+    if os.path.isdir(source):
+        names = sorted(name for name in os.listdir(source) if name.lower().endswith(IMAGE_EXTENSIONS))
+        return [os.path.join(source, name) for name in names]
+
+    base = os.path.dirname(os.path.abspath(source))
+    with open(source, encoding="utf-8") as manifest:
+        lines = [line.strip() for line in manifest]
+    return [os.path.join(base, line) for line in lines if line and not line.startswith("#")]
+
+# Output path in output_dir; carriers in lossy formats are written as PNG so the hidden bits survive
+def lossless_output_path(input_path, output_dir):
+    name, extension = os.path.splitext(os.path.basename(input_path))
+    if extension.lower() not in LOSSLESS_EXTENSIONS:
+        extension = ".png"
+    return os.path.join(output_dir, name + extension)
+
+def _hide_job(input_path, output_path, payload, bits_per_channel, channels, key):
+    start = time.perf_counter()
+    result = {"input": input_path, "output": output_path}
+    try:
+        hide_payload(input_path, payload, output_path, bits_per_channel, channels, key)
+        result["bytes"] = len(payload)
+    except Exception as error:  # Report per image instead of aborting the whole batch
+        result["error"] = f"{type(error).__name__}: {error}"
+    result["seconds"] = time.perf_counter() - start
+    return result
+
+def _extract_job(input_path, key):
+    start = time.perf_counter()
+    result = {"input": input_path}
+    try:
+        result["payload"] = extract_payload(input_path, key)
+    except Exception as error:
+        result["error"] = f"{type(error).__name__}: {error}"
+    result["seconds"] = time.perf_counter() - start
+    return result
+
+# Jobs in flight per worker; submitting in a bounded window keeps huge manifests from being pickled at once
+JOB_WINDOW_PER_WORKER = 4
+
+def _run_jobs(job, argument_lists, workers):
+    if workers == 1:
+        for arguments in zip(*argument_lists):
+            yield job(*arguments)
+        return
+    window = (workers or os.cpu_count() or 1) * JOB_WINDOW_PER_WORKER
+    pending = deque()
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for arguments in zip(*argument_lists):
+            if len(pending) >= window:
+                yield pending.popleft().result()  # Results are yielded in input order
+            pending.append(executor.submit(job, *arguments))
+        while pending:
+            yield pending.popleft().result()
+
+# Hide payloads in every image of a directory or manifest, yielding one result dict per image in order.
+# `payloads` is one payload for every image, or a list with one payload per scanned image.
+def batch_hide(source, payloads, output_dir, bits_per_channel=1, channels="R", key=None, workers=None):
+    paths = scan_images(source)
+    if isinstance(payloads, (str, bytes, bytearray)):
+        payloads = [payloads] * len(paths)
+    elif len(payloads) != len(paths):
+        raise ValueError(f"Got {len(payloads)} payloads for {len(paths)} images.")
+    os.makedirs(output_dir, exist_ok=True)
+    outputs = [lossless_output_path(path, output_dir) for path in paths]
+    if len(set(outputs)) != len(outputs):
+        raise ValueError("Several carriers would be written to the same output file.")
+    count = len(paths)
+    yield from _run_jobs(_hide_job, (paths, outputs, payloads, [bits_per_channel] * count,
+                                     [channels] * count, [key] * count), workers)
+
+# Extract payloads from every image of a directory or manifest, yielding one result dict per image in order
+def batch_extract(source, key=None, workers=None):
+    paths = scan_images(source)
+    yield from _run_jobs(_extract_job, (paths, [key] * len(paths)), workers)
+
+# Sample usage of the functions
+# Define file paths
@@ -0,0 +1,15 @@
+# Lab modules are loaded on first attribute access (ib_task.Lab4, from ib_task import Lab2),
+# so importing the package itself runs no demo and pulls in none of numpy, matplotlib, Crypto or PIL.
+import importlib
+
+__all__ = ["Lab1", "Lab2", "Lab3", "Lab4", "Lab5", "Lab6", "key_schedule", "parallel", "benchmark"]
+
+def __getattr__(name):
+    if name not in __all__:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module("." + name, __name__)
+    globals()[name] = module  # Later lookups skip __getattr__
+    return module
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,171 @@
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+import numpy as np
+from bitarray import bitarray
+
+from . import Lab1, Lab2
+from .parallel import shard_count
+
+BLOCK_BYTES = 8
+
+# Payload sizes swept by default (1 KB to 1 GB)
+DEFAULT_SIZES = ["1K", "32K", "1M", "32M", "1G"]
+DEFAULT_ROUNDS = [2, 4, 8]
+# "scalar" is the chained CBC/CFB encryption, which runs one Python-level step per block
+ENGINES = ["bitarray", "scalar", "numpy", "parallel"]
+
+# The per-block bitarray loops need minutes per hundred MB, so larger payloads are skipped for them
+DEFAULT_MAX_BITARRAY_SIZE = "4M"
+# The scalar engine runs at a few MB/s and holds every block as a Python int, so it is capped as well
+DEFAULT_MAX_SCALAR_SIZE = "16M"
+
+# Parse sizes such as "64K", "1M" or "1G" into a byte count rounded down to whole blocks
+def parse_size(text):
+    units = {"K": 1 << 10, "M": 1 << 20, "G": 1 << 30}
+    text = text.strip().upper()
+    multiplier = units.get(text[-1], 1)
+    number = text[:-1] if text[-1] in units else text
+    size = int(float(number) * multiplier)
+    return max(BLOCK_BYTES, size - size % BLOCK_BYTES)
+
+def to_bitarray(data):
+    bits = bitarray()
+    bits.frombytes(data)
+    return bits
+
+# Benchmark cases: name -> {engine: function(payload_bits, payload_bytes, key, IV, num_rounds)}
+CASES = {
+    "lab1_encrypt": {
+        "bitarray": lambda bits, data, key, IV, rounds: Lab1.encrypt(bits, key, rounds),
+        "numpy": lambda bits, data, key, IV, rounds: Lab1.encrypt_numpy(bits, key, rounds),
+        "parallel": lambda bits, data, key, IV, rounds: Lab1.encrypt_parallel(bits, key, rounds),
+    },
+    "lab1_decrypt": {
+        "bitarray": lambda bits, data, key, IV, rounds: Lab1.decrypt(bits, key, rounds),
+        "numpy": lambda bits, data, key, IV, rounds: Lab1.decrypt_numpy(bits, key, rounds),
+        "parallel": lambda bits, data, key, IV, rounds: Lab1.decrypt_parallel(bits, key, rounds),
+    },
+    "lab2_encrypt_CBC": {
+        "bitarray": lambda bits, data, key, IV, rounds: Lab2.encrypt_CBC(bits, key, IV, rounds),
+        "scalar": lambda bits, data, key, IV, rounds: Lab2.CBCEncryptor(key, IV, rounds).update(data),
+    },
+    "lab2_decrypt_CBC": {
+        "bitarray": lambda bits, data, key, IV, rounds: Lab2.decrypt_CBC(bits, key, IV, rounds),
+        "numpy": lambda bits, data, key, IV, rounds: Lab2.decrypt_CBC_parallel(bits, key, IV, rounds, workers=1),
+        "parallel": lambda bits, data, key, IV, rounds: Lab2.decrypt_CBC_parallel(bits, key, IV, rounds),
+    },
+    "lab2_encrypt_CFB": {
+        "bitarray": lambda bits, data, key, IV, rounds: Lab2.encrypt_CFB(bits, key, IV, rounds),
+        "scalar": lambda bits, data, key, IV, rounds: Lab2.CFBEncryptor(key, IV, rounds).update(data),
+    },
+    "lab2_decrypt_CFB": {
+        "bitarray": lambda bits, data, key, IV, rounds: Lab2.decrypt_CFB(bits, key, IV, rounds),
+        "numpy": lambda bits, data, key, IV, rounds: Lab2.decrypt_CFB_parallel(bits, key, IV, rounds, workers=1),
+        "parallel": lambda bits, data, key, IV, rounds: Lab2.decrypt_CFB_parallel(bits, key, IV, rounds),
+    },
+    "lab2_CTR": {
+        "numpy": lambda bits, data, key, IV, rounds: Lab2.encrypt_CTR(bits, key, IV, rounds),
+        "parallel": lambda bits, data, key, IV, rounds: Lab2.encrypt_CTR_parallel(bits, key, IV, rounds),
+    },
+}
+
+# Time one function call, keeping the best of `repeat` runs
+def time_call(function, args, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function(*args)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def run_benchmarks(sizes, rounds_list, engines, cases, repeat=3, max_bitarray_size=None, max_scalar_size=None):
+    size_limits = {"bitarray": (max_bitarray_size, "--max-bitarray-size"),
+                   "scalar": (max_scalar_size, "--max-scalar-size")}
+    key = to_bitarray(os.urandom(8))
+    IV = to_bitarray(os.urandom(8))
+    results = []
+
+    for size in sizes:
+        data = os.urandom(size)
+        bits = to_bitarray(data)
+        for num_rounds in rounds_list:
+            for case in cases:
+                for engine in engines:
+                    function = CASES[case].get(engine)
+                    if function is None:
+                        continue  # Engine not available for this case
+                    # Processes map_blocks actually uses; small payloads run in-process
+                    workers = shard_count(size // BLOCK_BYTES) if engine == "parallel" else 1
+                    record = {"case": case, "engine": engine, "size": size, "rounds": num_rounds, "workers": workers}
+                    limit, option = size_limits.get(engine, (None, None))
+                    if limit and size > limit:
+                        record["skipped"] = f"payload larger than {option}"
+                        results.append(record)
+                        continue
+
+                    seconds = time_call(function, (bits, data, key, IV, num_rounds), repeat)
+                    record["seconds"] = seconds
+                    record["mb_per_s"] = size / (1 << 20) / seconds if seconds else None
+                    record["block_latency_us"] = seconds / (size // BLOCK_BYTES) * 1e6
+                    results.append(record)
+                    print(f"{case:18} {engine:9} {size:>12} B  r={num_rounds:<2} "
+                          f"{record['mb_per_s']:10.2f} MB/s  {record['block_latency_us']:9.4f} us/block",
+                          file=sys.stderr)
+    return results
+
+# Environment details stored next to the numbers so runs can be compared across releases
+def environment():
+    return {
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "processor": platform.processor(),
+        "cpu_count": os.cpu_count(),
+    }
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Throughput benchmark for the Lab1/Lab2 block ciphers")
+    parser.add_argument("--sizes", default=",".join(DEFAULT_SIZES), help="comma-separated payload sizes (e.g. 1K,1M,1G)")
+    parser.add_argument("--rounds", default=",".join(map(str, DEFAULT_ROUNDS)), help="comma-separated round counts")
+    parser.add_argument("--engines", default=",".join(ENGINES), help="comma-separated engines: " + ", ".join(ENGINES))
+    parser.add_argument("--cases", default=",".join(CASES), help="comma-separated cases: " + ", ".join(CASES))
+    parser.add_argument("--repeat", type=int, default=3, help="runs per measurement (best is kept)")
+    parser.add_argument("--max-bitarray-size", default=DEFAULT_MAX_BITARRAY_SIZE,
+                        help="largest payload for the bitarray engine (0 for no limit)")
+    parser.add_argument("--max-scalar-size", default=DEFAULT_MAX_SCALAR_SIZE,
+                        help="largest payload for the scalar engine (0 for no limit)")
+    parser.add_argument("--output", help="write JSON results to this file instead of stdout")
+    args = parser.parse_args(argv)
+
+    sizes = [parse_size(size) for size in args.sizes.split(",")]
+    rounds_list = [int(rounds) for rounds in args.rounds.split(",")]
+    engines = [engine.strip() for engine in args.engines.split(",")]
+    cases = [case.strip() for case in args.cases.split(",")]
+    for name in engines:
+        if name not in ENGINES:
+            parser.error(f"unknown engine: {name}")
+    for name in cases:
+        if name not in CASES:
+            parser.error(f"unknown case: {name}")
+    max_bitarray_size = parse_size(args.max_bitarray_size) if args.max_bitarray_size != "0" else None
+    max_scalar_size = parse_size(args.max_scalar_size) if args.max_scalar_size != "0" else None
+
+    report = {
+        "environment": environment(),
+        "results": run_benchmarks(sizes, rounds_list, engines, cases, args.repeat, max_bitarray_size,
+                                  max_scalar_size),
+    }
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as file:
+            file.write(text + "\n")
+    else:
+        print(text)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,321 @@
+import argparse
+import importlib
+import json
+import runpy
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+# Command line entry point: python -m ib_task [--profile] <lab> <action> ...
+# Only the lab module a command needs is imported, and only once its arguments have been parsed.
+
+CHUNK_SIZE = 1 << 20
+# Third-party packages called out in the profile's import column
+HEAVY_MODULES = ("numpy", "bitarray", "matplotlib", "Crypto", "PIL")
+# Lab1 decrypt and Lab2 decrypt_block do not invert their encryption, so the CLI offers no Lab1 decryption
+# and no CBC decryption. CFB and CTR only run the block cipher forwards and round-trip correctly.
+LAB2_CIPHERS = {
+    ("CBC", "encrypt"): "CBCEncryptor",
+    ("CFB", "encrypt"): "CFBEncryptor", ("CFB", "decrypt"): "CFBDecryptor",
+    ("CTR", "encrypt"): "CTRCipher", ("CTR", "decrypt"): "CTRCipher",
+}
+
+# Per-stage wall time, Python allocations and newly imported modules for --profile.
+# tracemalloc only runs while profiling, since tracing slows every allocation down.
+class StageProfiler:
+    def __init__(self, enabled=False):
+        self.enabled = enabled
+        self.stages = []
+        if enabled:
+            tracemalloc.start()
+
+    @contextmanager
+    def stage(self, name):
+        if not self.enabled:
+            yield
+            return
+        modules_before = set(sys.modules)
+        tracemalloc.reset_peak()
+        memory_before = tracemalloc.get_traced_memory()[0]
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            seconds = time.perf_counter() - start
+            current, peak = tracemalloc.get_traced_memory()
+            imported = {module.partition(".")[0] for module in set(sys.modules) - modules_before}
+            self.stages.append({"stage": name, "seconds": seconds, "allocated": current - memory_before,
+                                "peak": peak - memory_before, "imported": sorted(imported)})
+
+    def report(self, file=None):
+        file = file or sys.stderr
+        print(f"{'stage':24} {'seconds':>9} {'allocated':>11} {'peak':>11}  imported modules", file=file)
+        for stage in self.stages:
+            heavy = [module for module in stage["imported"] if module in HEAVY_MODULES]
+            imported = f"{len(stage['imported'])}" + (f" ({', '.join(heavy)})" if heavy else "")
+            print(f"{stage['stage']:24} {stage['seconds']:9.4f} {_mib(stage['allocated']):>11} "
+                  f"{_mib(stage['peak']):>11}  {imported}", file=file)
+        print(f"{'total':24} {sum(stage['seconds'] for stage in self.stages):9.4f}", file=file)
+
+def _mib(size):
+    return f"{size / (1 << 20):.2f} MiB"
+
+# argparse type for 64-bit keys and IVs given as 16 hex digits
+def _block_hex(text):
+    try:
+        value = bytes.fromhex(text)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"not a hex string: {text!r}")
+    if len(value) != 8:
+        raise argparse.ArgumentTypeError("expected 16 hex digits (8 bytes)")
+    return value
+
+def _read_chunks(path, chunk_size=CHUNK_SIZE):
+    with open(path, "rb") as file:
+        while True:
+            chunk = file.read(chunk_size)
+            if not chunk:
+                return
+            yield chunk
+
+def _read_text(path):
+    with open(path, encoding="utf-8") as file:
+        return file.read()
+
+def _write_output(data, path):
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    if path:
+        with open(path, "wb") as file:
+            file.write(data)
+    else:
+        sys.stdout.buffer.write(data)
+        sys.stdout.flush()
+
+# Handlers take the imported lab module, the parsed arguments and the profiler
+
+def _lab1(lab, args, profiler):
+    from bitarray import bitarray
+
+    key = bitarray()
+    key.frombytes(args.key)
+    with profiler.stage("encrypt"):
+        lab.encrypt_file(args.input, args.output, key, args.rounds)
+
+def _lab2(lab, args, profiler):
+    with profiler.stage("key schedule"):
+        cipher_class = getattr(lab, LAB2_CIPHERS[args.mode, args.action])
+        cipher = cipher_class(lab.bytestring_to_bitarray(args.key), lab.bytestring_to_bitarray(args.iv), args.rounds)
+    with profiler.stage(f"{args.action} {args.mode}"):
+        with open(args.output, "wb") as output:
+            for chunk in _read_chunks(args.input):
+                output.write(cipher.update(chunk))
+            output.write(cipher.finalize())
+
+def _lab3(lab, args, profiler):
+    M, C, P = args.multiplier, args.increment, args.modulus
+    if args.action == "cycle":
+        with profiler.stage("cycle length"):
+            length = lab.lcg_cycle_length(args.seed, M, C, P)
+        print(length)
+    elif args.action == "generate":
+        import numpy as np
+
+        with profiler.stage("generate"):
+            values = lab.parallel_lcg_array(args.seed, args.count, M, C, P, workers=args.workers)
+        with profiler.stage("write"):
+            np.save(args.output, values)
+    else:
+        with profiler.stage("analyze"):
+            report = lab.analyze_stream(lab.lcg_chunks(args.seed, M, C, P, total=args.count))
+        print(json.dumps(report, indent=2, default=lambda value: value.tolist()))
+
+def _lab4(lab, args, profiler):
+    store = lab.RSAKeyStore(args.store)
+    if args.action == "keygen":
+        with profiler.stage("generate key"):
+            key_id = store.generate(args.bits)
+        print(key_id)
+        return
+
+    with profiler.stage("load key"):
+        if args.action == "encrypt":
+            key_id = args.key_id or store.get_or_generate(args.bits)
+            key = store.load_public(key_id)
+        else:
+            ids = store.ids()
+            if not args.key_id and not ids:
+                raise ValueError(f"No keys in {args.store}.")
+            key_id = args.key_id or ids[0]
+            key = store.load_private(key_id)
+    print(f"key id: {key_id}", file=sys.stderr)
+    with profiler.stage(args.action):
+        if args.action == "encrypt":
+            lab.envelope_encrypt_file(args.input, args.output, key, args.mode, args.rounds)
+        else:
+            lab.envelope_decrypt_file(args.input, args.output, key)
+
+def _lab5(lab, args, profiler):
+    with profiler.stage("read"):
+        text = _read_text(args.input)
+    if args.action == "ngrams":
+        with profiler.stage("count"):
+            counts = lab.count_ngrams(text, args.max_n)
+        for n in range(1, args.max_n + 1):
+            print(f"{n}: {' '.join(counts.top(n, args.top))}")
+        return
+
+    with profiler.stage("load model"):
+        model = lab.load_language_model()
+    with profiler.stage("solve"):
+        plaintext, char_mapping, score = lab.SubstitutionSolver(text, model).solve(args.restarts, args.workers,
+                                                                                    args.seed)
+    print(f"score: {score:.2f}", file=sys.stderr)
+    print("mapping: " + " ".join(f"{cipher}->{plain}" for cipher, plain in sorted(char_mapping.items())),
+          file=sys.stderr)
+    with profiler.stage("write"):
+        _write_output(plaintext, args.output)
+
+def _lab6(lab, args, profiler):
+    if args.action == "capacity":
+        with profiler.stage("capacity"):
+            capacity = lab.payload_capacity(args.image, args.bits, args.channels)
+        print(capacity)
+    elif args.action == "hide":
+        if args.message is not None:
+            payload = args.message
+        else:
+            with open(args.payload_file, "rb") as file:
+                payload = file.read()
+        with profiler.stage("embed"):
+            lab.hide_payload(args.image, payload, args.output, args.bits, args.channels, args.key)
+    else:
+        with profiler.stage("extract"):
+            payload = lab.extract_payload(args.image, args.key)
+        _write_output(payload, args.output)
+
+def _benchmark(lab, args, profiler):
+    arguments = args.arguments[1:] if args.arguments[:1] == ["--"] else args.arguments
+    with profiler.stage("benchmark"):
+        lab.main(arguments)
+
+# Runs a module's original demo; the module is executed by runpy, so it is not imported beforehand
+def _demo(lab, args, profiler):
+    with profiler.stage(f"demo {args.lab}"):
+        runpy.run_module(f"{__package__}.{args.lab}", run_name="__main__")
+
+def _action(actions, name, help, module, handler):
+    parser = actions.add_parser(name, help=help)
+    parser.set_defaults(action=name, module=module, handler=handler)
+    return parser
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="python -m ib_task", description="Run the lab algorithms on your own input.")
+    parser.add_argument("--profile", action="store_true",
+                        help="report wall time, allocations and newly imported modules per stage on stderr "
+                             "(allocation tracing slows the run; python -X importtime breaks imports down further)")
+    labs = parser.add_subparsers(dest="command", required=True, metavar="command")
+
+    actions = labs.add_parser("lab1", help="Feistel cipher (ECB), streamed over files").add_subparsers(required=True)
+    action = _action(actions, "encrypt", "encrypt a file", "Lab1", _lab1)
+    action.add_argument("input")
+    action.add_argument("output")
+    action.add_argument("--key", type=_block_hex, required=True, help="64-bit key as 16 hex digits")
+    action.add_argument("--rounds", type=int, default=2)
+
+    actions = labs.add_parser("lab2", help="block cipher modes CBC, CFB and CTR").add_subparsers(required=True)
+    for name in ("encrypt", "decrypt"):
+        action = _action(actions, name, f"{name} a file", "Lab2", _lab2)
+        action.add_argument("input")
+        action.add_argument("output")
+        action.add_argument("--key", type=_block_hex, required=True, help="64-bit key as 16 hex digits")
+        action.add_argument("--iv", type=_block_hex, required=True, help="64-bit IV as 16 hex digits")
+        modes = [mode for mode, mode_action in LAB2_CIPHERS if mode_action == name]
+        action.add_argument("--mode", choices=modes, default="CTR")
+        action.add_argument("--rounds", type=int, default=2)
+
+    actions = labs.add_parser("lab3", help="linear congruential generator").add_subparsers(required=True)
+    cycle = _action(actions, "cycle", "print the cycle length", "Lab3", _lab3)
+    generate = _action(actions, "generate", "write values in [0, 1) to a .npy file", "Lab3", _lab3)
+    generate.add_argument("output")
+    generate.add_argument("--workers", type=int)
+    analyze = _action(actions, "analyze", "run the statistical test battery", "Lab3", _lab3)
+    for action in (cycle, generate, analyze):
+        action.add_argument("--seed", type=int, default=0)
+        action.add_argument("--multiplier", type=int, default=101)
+        action.add_argument("--increment", type=int, default=1)
+        action.add_argument("--modulus", type=int, default=2 ** 32)
+    for action in (generate, analyze):
+        action.add_argument("--count", type=int, default=1 << 20)
+
+    actions = labs.add_parser("lab4", help="RSA keys and hybrid envelopes").add_subparsers(required=True)
+    keygen = _action(actions, "keygen", "generate a key into the store and print its ID", "Lab4", _lab4)
+    keygen.add_argument("--bits", type=int, default=2048)
+    for name in ("encrypt", "decrypt"):
+        action = _action(actions, name, f"{name} a file as an RSA envelope", "Lab4", _lab4)
+        action.add_argument("input")
+        action.add_argument("output")
+        action.add_argument("--key-id", help="stored key to use (default: the first key in the store)")
+    encrypt, decrypt = actions.choices["encrypt"], actions.choices["decrypt"]
+    encrypt.add_argument("--mode", choices=("CTR", "CFB"), default="CTR")
+    encrypt.add_argument("--rounds", type=int, default=4)
+    encrypt.add_argument("--bits", type=int, default=2048, help="size of the key generated for an empty store")
+    for action in (keygen, encrypt, decrypt):
+        action.add_argument("--store", default="keys", help="key store directory")
+
+    actions = labs.add_parser("lab5", help="substitution cipher analysis").add_subparsers(required=True)
+    solve = _action(actions, "solve", "break a substitution cipher", "Lab5", _lab5)
+    solve.add_argument("input")
+    solve.add_argument("-o", "--output", help="plaintext file (default: stdout)")
+    solve.add_argument("--restarts", type=int, default=8)
+    solve.add_argument("--workers", type=int)
+    solve.add_argument("--seed", type=int, default=0)
+    ngrams = _action(actions, "ngrams", "print the most frequent n-grams", "Lab5", _lab5)
+    ngrams.add_argument("input")
+    ngrams.add_argument("--max-n", type=int, default=3)
+    ngrams.add_argument("--top", type=int, default=10)
+
+    actions = labs.add_parser("lab6", help="LSB steganography").add_subparsers(required=True)
+    hide = _action(actions, "hide", "hide a message or file in an image", "Lab6", _lab6)
+    hide.add_argument("image")
+    hide.add_argument("output", help="output image in a lossless format (.png, .bmp, .tif, .tiff or .ppm)")
+    payload = hide.add_mutually_exclusive_group(required=True)
+    payload.add_argument("--message")
+    payload.add_argument("--payload-file")
+    extract = _action(actions, "extract", "extract a hidden payload", "Lab6", _lab6)
+    extract.add_argument("image")
+    extract.add_argument("-o", "--output", help="payload file (default: stdout)")
+    capacity = _action(actions, "capacity", "print how many payload bytes an image holds", "Lab6", _lab6)
+    capacity.add_argument("image")
+    for action in (hide, capacity):
+        action.add_argument("--bits", type=int, default=1, help="low bits used per channel (1-8)")
+        action.add_argument("--channels", default="R", help="channels carrying data, e.g. R, RGB or RGBA")
+    for action in (hide, extract):
+        action.add_argument("--key", help="permutes the payload pixels; needed again to extract")
+
+    benchmark = labs.add_parser("benchmark", help="Lab1/Lab2 throughput benchmark (options after --)")
+    benchmark.add_argument("arguments", nargs=argparse.REMAINDER)
+    benchmark.set_defaults(module="benchmark", handler=_benchmark)
+
+    demo = labs.add_parser("demo", help="run a module's original demo")
+    demo.add_argument("lab", choices=("Lab1", "Lab2", "Lab3", "Lab4", "Lab5"))
+    demo.set_defaults(module=None, handler=_demo)
+    return parser
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    profiler = StageProfiler(args.profile)
+    try:
+        lab = None
+        if args.module:
+            with profiler.stage(f"import {args.module}"):
+                lab = importlib.import_module("." + args.module, __package__)
+        args.handler(lab, args, profiler)
+    except (ValueError, OSError) as error:
+        print(f"error: {error}", file=sys.stderr)
+        return 1
+    finally:
+        if args.profile:
+            profiler.report()
+    return 0
@@ -0,0 +1,56 @@
+from functools import lru_cache
+from bitarray import bitarray
+from bitarray.util import ba2int
+
+# Number of (key, num_rounds) schedules kept in memory before the least recently used is evicted
+KEY_SCHEDULE_CACHE_SIZE = 128
+
+# Shift function matching the one used by the Lab1/Lab2 ciphers
+def right_shift(array, n):
+    length = len(array)
+    res = bitarray(length)
+    res.setall(0)  # Initialize with zeros
+    if n < length:
+        res[n:] = array[:length - n]  # Shift bits to the right
+    return res
+
+# Round subkeys derived once per (key, num_rounds)
+class KeySchedule:
+    def __init__(self, key, num_rounds=2):
+        if num_rounds < 1:
+            raise ValueError("At least one round is required.")
+        if len(key) < 32:
+            raise ValueError("The key must be at least 32 bits long.")
+
+        self.num_rounds = num_rounds
+        self.round_keys = []  # Key segments already shifted right by 2, ready to XOR inside F
+        for round_number in range(num_rounds):
+            key_segment = right_shift(key, round_number * 8)[:32]
+            self.round_keys.append(right_shift(key_segment, 2))
+
+        # Integer form of the same subkeys for word-based engines
+        self.round_key_ints = [ba2int(round_key) for round_key in self.round_keys]
+
+    def __repr__(self):
+        return f"KeySchedule(num_rounds={self.num_rounds})"
+
+# Build a schedule from raw key bytes; LRU-cached so reused keys are expanded only once
+@lru_cache(maxsize=KEY_SCHEDULE_CACHE_SIZE)
+def _cached_schedule(key_bytes, key_length, num_rounds):
+    key = bitarray()
+    key.frombytes(key_bytes)
+    return KeySchedule(key[:key_length], num_rounds)
+
+# Accept either a bitarray key or an existing schedule and return the schedule to use.
+# The cache key is taken from a big-endian copy: tobytes() of a little-endian key packs
+# the same bit sequence differently, and _cached_schedule unpacks big-endian.
+def get_key_schedule(key, num_rounds=2):
+    if isinstance(key, KeySchedule):
+        if key.num_rounds != num_rounds:
+            raise ValueError("Key schedule was built for a different number of rounds.")
+        return key
+    return _cached_schedule(bitarray(key, endian="big").tobytes(), len(key), num_rounds)
+
+# Drop every cached schedule (e.g. after key rotation)
+def clear_key_schedule_cache():
+    _cached_schedule.cache_clear()
@@ -0,0 +1,112 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+import numpy as np
+
+# Shards smaller than this are not worth sending to another process
+MIN_SHARD_BLOCKS = 1 << 14
+
+# Split n_blocks into at most n_shards contiguous (start, stop) ranges on block boundaries
+def shard_bounds(n_blocks, n_shards):
+    n_shards = max(1, min(n_shards, n_blocks))
+    step, extra = divmod(n_blocks, n_shards)
+    bounds = []
+    start = 0
+    for shard in range(n_shards):
+        stop = start + step + (1 if shard < extra else 0)
+        bounds.append((start, stop))
+        start = stop
+    return bounds
+
+# Number of shards (processes) map_blocks and fill_array use for n_items; 1 means the work runs in-process
+def shard_count(n_items, workers=None, min_shard_size=MIN_SHARD_BLOCKS):
+    workers = workers or os.cpu_count() or 1
+    return max(1, min(workers, n_items // min_shard_size))
+
+# Worker: view the shared input/output buffers and fill output[start:stop]
+def _run_shard(transform, input_name, output_name, n_words, start, stop, args):
+    input_shm = shared_memory.SharedMemory(name=input_name)  # Workers only attach; the parent unlinks
+    output_shm = shared_memory.SharedMemory(name=output_name)
+    try:
+        words = np.ndarray((n_words,), dtype=np.uint64, buffer=input_shm.buf)
+        result = np.ndarray((n_words,), dtype=np.uint64, buffer=output_shm.buf)
+        result[start:stop] = transform(words, start, stop, *args)
+        del words, result  # Release the buffer views before closing
+    finally:
+        input_shm.close()
+        output_shm.close()
+
+# Apply transform(words, start, stop, *args) to every shard of a uint64 block array on a process pool.
+# The blocks travel through shared memory and the shards are written back in place, so output order
+# always matches input order.
+def map_blocks(transform, words, args=(), workers=None, min_shard_blocks=MIN_SHARD_BLOCKS):
+    words = np.ascontiguousarray(words, dtype=np.uint64)
+    n_words = len(words)
+    n_shards = shard_count(n_words, workers, min_shard_blocks)
+
+    # Small inputs run in-process
+    if n_shards == 1:
+        return np.asarray(transform(words, 0, n_words, *args), dtype=np.uint64)
+
+    input_shm = shared_memory.SharedMemory(create=True, size=words.nbytes)
+    output_shm = shared_memory.SharedMemory(create=True, size=words.nbytes)
+    try:
+        shared_words = np.ndarray((n_words,), dtype=np.uint64, buffer=input_shm.buf)
+        shared_words[:] = words
+        del shared_words
+
+        with ProcessPoolExecutor(max_workers=n_shards) as executor:
+            futures = [
+                executor.submit(_run_shard, transform, input_shm.name, output_shm.name, n_words, start, stop, args)
+                for start, stop in shard_bounds(n_words, n_shards)
+            ]
+            for future in futures:
+                future.result()  # Re-raise any worker error
+
+        shared_result = np.ndarray((n_words,), dtype=np.uint64, buffer=output_shm.buf)
+        result = shared_result.copy()
+        del shared_result
+        return result
+    finally:
+        input_shm.close()
+        input_shm.unlink()
+        output_shm.close()
+        output_shm.unlink()
+
+# Worker: fill output[start:stop] of a shared array with function(start, stop, *args)
+def _fill_shard(function, output_name, length, dtype, start, stop, args):
+    output_shm = shared_memory.SharedMemory(name=output_name)
+    try:
+        result = np.ndarray((length,), dtype=dtype, buffer=output_shm.buf)
+        result[start:stop] = function(start, stop, *args)
+        del result
+    finally:
+        output_shm.close()
+
+# Build an array of `length` items where each shard comes from function(start, stop, *args) on a process pool.
+# Workers write straight into one shared output buffer, so nothing is pickled on the way back.
+def fill_array(function, length, dtype=np.float64, args=(), workers=None, min_shard_size=MIN_SHARD_BLOCKS):
+    dtype = np.dtype(dtype)
+    n_shards = shard_count(length, workers, min_shard_size)
+
+    # Small outputs run in-process
+    if n_shards == 1:
+        return np.asarray(function(0, length, *args), dtype=dtype)
+
+    output_shm = shared_memory.SharedMemory(create=True, size=max(1, length * dtype.itemsize))
+    try:
+        with ProcessPoolExecutor(max_workers=n_shards) as executor:
+            futures = [
+                executor.submit(_fill_shard, function, output_shm.name, length, dtype, start, stop, args)
+                for start, stop in shard_bounds(length, n_shards)
+            ]
+            for future in futures:
+                future.result()  # Re-raise any worker error
+
+        shared_result = np.ndarray((length,), dtype=dtype, buffer=output_shm.buf)
+        result = shared_result.copy()
+        del shared_result
+        return result
+    finally:
+        output_shm.close()
+        output_shm.unlink()
@@ -0,0 +1,13 @@
+import os
+
+import pytest
+from bitarray import bitarray
+
+@pytest.fixture
+def random_bits():
+    # Factory for random keys, IVs and plaintexts: random_bits(size_in_bytes, endian="big")
+    def make(size, endian="big"):
+        bits = bitarray(endian=endian)
+        bits.frombytes(os.urandom(size))
+        return bits
+    return make
@@ -0,0 +1,75 @@
+import pytest
+from bitarray import bitarray
+
+from ib_task import Lab1, Lab2
+from ib_task.key_schedule import KeySchedule, clear_key_schedule_cache, get_key_schedule
+
+# Reference ciphers that derive every round key inline, as the labs did before key schedules existed
+
+def reference_lab1_encrypt(plaintext, key, num_rounds):
+    ciphertext = bitarray()
+    for index in range(0, len(plaintext), 64):
+        block = plaintext[index:index + 64]
+        left, right = block[:32], block[32:]
+        for round_number in range(num_rounds):
+            new_right = Lab1.F(left, Lab1.right_shift(key, round_number * 8)[:32]) ^ right
+            new_block = left + new_right if round_number == num_rounds - 1 else new_right + left
+            left, right = new_right, left
+        ciphertext += new_block
+    return ciphertext
+
+def reference_lab1_decrypt(ciphertext, key, num_rounds):
+    plaintext = bitarray()
+    for index in range(0, len(ciphertext), 64):
+        block = ciphertext[index:index + 64]
+        left, right = block[:32], block[32:]
+        for round_number in range(num_rounds - 1, -1, -1):
+            new_left = Lab1.F(right, Lab1.right_shift(key, round_number * 8)[:32]) ^ left
+            new_block = right + new_left if round_number == 0 else new_left + right
+            left, right = right, new_left
+        plaintext += new_block
+    return plaintext
+
+def reference_lab2_encrypt_block(block, key, num_rounds):
+    for round_number in range(num_rounds):
+        left, right = block[:32], block[32:]
+        transformed = Lab2.transformation(left, Lab2.right_shift(key, round_number * 8)[:32]) ^ right
+        block = left + transformed if round_number == num_rounds - 1 else transformed + left
+    return block
+
+def reference_lab2_decrypt_block(block, key, num_rounds):
+    for round_number in range(num_rounds):
+        left, right = block[:32], block[32:]
+        key_segment = Lab2.right_shift(key, (num_rounds - round_number - 1) * 8)[:32]
+        transformed = Lab2.transformation(right, key_segment) ^ left
+        block = right + transformed if round_number == num_rounds - 1 else transformed + right
+    return block
+
+@pytest.mark.parametrize("endian", ["big", "little"])
+@pytest.mark.parametrize("num_rounds", [1, 2, 4, 8])
+def test_lab1_matches_reference(endian, num_rounds, random_bits):
+    key = random_bits(8, endian)
+    plaintext = random_bits(8 * 16)
+    assert Lab1.encrypt(plaintext, key, num_rounds) == reference_lab1_encrypt(plaintext, key, num_rounds)
+    assert Lab1.decrypt(plaintext, key, num_rounds) == reference_lab1_decrypt(plaintext, key, num_rounds)
+
+@pytest.mark.parametrize("endian", ["big", "little"])
+@pytest.mark.parametrize("num_rounds", [1, 2, 4, 8])
+def test_lab2_blocks_match_reference(endian, num_rounds, random_bits):
+    key = random_bits(8, endian)
+    for _ in range(8):
+        block = random_bits(8)
+        assert Lab2.encrypt_block(block, key, num_rounds) == reference_lab2_encrypt_block(block, key, num_rounds)
+        assert Lab2.decrypt_block(block, key, num_rounds) == reference_lab2_decrypt_block(block, key, num_rounds)
+
+def test_little_endian_key_uses_same_schedule(random_bits):
+    clear_key_schedule_cache()
+    big_key = random_bits(8)
+    little_key = bitarray(big_key, endian="little")  # Same bit sequence, different byte packing
+    assert get_key_schedule(little_key, 4) is get_key_schedule(big_key, 4)
+    assert get_key_schedule(big_key, 4).round_key_ints == KeySchedule(big_key, 4).round_key_ints
+
+def test_schedule_round_mismatch(random_bits):
+    schedule = get_key_schedule(random_bits(8), 2)
+    with pytest.raises(ValueError):
+        get_key_schedule(schedule, 4)
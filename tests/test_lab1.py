@@ -0,0 +1,94 @@
+import os
+
+import pytest
+from bitarray import bitarray
+
+from ib_task import Lab1
+
+def bits_from_bytes(data):
+    bits = bitarray()
+    bits.frombytes(data)
+    return bits
+
+def split(data, size):
+    return [data[start:start + size] for start in range(0, len(data), size)]
+
+@pytest.mark.parametrize("length", [0, 1, 7, 8, 9, 100, 4096 + 3])
+@pytest.mark.parametrize("chunk_size", [1, 5, 8, 1000])
+def test_stream_records_and_strips_padding(length, chunk_size, random_bits):
+    key = random_bits(8)
+    data = os.urandom(length)
+    encrypted = b"".join(Lab1.encrypt_stream(split(data, chunk_size), key, 4))
+    body, trailer = encrypted[:-Lab1.STREAM_TRAILER.size], encrypted[-Lab1.STREAM_TRAILER.size:]
+
+    padded = data + b"\0" * (-length % 8)
+    assert body == Lab1.encrypt(bits_from_bytes(padded), key, 4).tobytes()
+    assert Lab1.STREAM_TRAILER.unpack(trailer) == (length,)
+
+    decrypted = b"".join(Lab1.decrypt_stream(split(encrypted, chunk_size), key, 4))
+    assert decrypted == Lab1.decrypt(bits_from_bytes(body), key, 4).tobytes()[:length]
+
+def test_stream_rejects_missing_or_wrong_trailer(random_bits):
+    key = random_bits(8)
+    encrypted = b"".join(Lab1.encrypt_stream([os.urandom(20)], key))
+    with pytest.raises(ValueError):
+        b"".join(Lab1.decrypt_stream([encrypted[:-Lab1.STREAM_TRAILER.size]], key))
+    with pytest.raises(ValueError):
+        b"".join(Lab1.decrypt_stream([encrypted[:-1] + b"\x40"], key))
+
+# Lab1.decrypt does not invert encrypt, so decrypt_file is checked against decrypt itself, not the source
+def test_decrypt_file_applies_decrypt_and_strips_padding(tmp_path, random_bits):
+    key = random_bits(8)
+    source, encrypted, decrypted = tmp_path / "plain", tmp_path / "enc", tmp_path / "dec"
+    source.write_bytes(os.urandom(1234))
+    Lab1.encrypt_file(source, encrypted, key, 4, chunk_size=64)
+    Lab1.decrypt_file(encrypted, decrypted, key, 4, chunk_size=64)
+    body = encrypted.read_bytes()[:-Lab1.STREAM_TRAILER.size]
+    assert decrypted.read_bytes() == Lab1.decrypt(bits_from_bytes(body), key, 4).tobytes()[:1234]
+
+@pytest.mark.parametrize("num_rounds", [1, 2, 3, 4, 8])
+def test_numpy_engine_is_bit_identical(num_rounds, random_bits):
+    key = random_bits(8)
+    plaintext = random_bits(8 * 37)
+    ciphertext = Lab1.encrypt(plaintext, key, num_rounds)
+    assert Lab1.encrypt_numpy(plaintext, key, num_rounds) == ciphertext
+    assert Lab1.decrypt_numpy(ciphertext, key, num_rounds) == Lab1.decrypt(ciphertext, key, num_rounds)
+
+def test_parallel_engine_matches_numpy(random_bits):
+    key = random_bits(8)
+    plaintext = random_bits(8 * 40000)
+    ciphertext = Lab1.encrypt_numpy(plaintext, key, 4)
+    assert Lab1.encrypt_parallel(plaintext, key, 4, workers=2) == ciphertext
+    assert Lab1.decrypt_parallel(ciphertext, key, 4, workers=2) == Lab1.decrypt_numpy(ciphertext, key, 4)
+
+def test_numpy_engine_rejects_partial_blocks(random_bits):
+    with pytest.raises(ValueError):
+        Lab1.encrypt_numpy(random_bits(12), random_bits(8))
+
+def test_file_chunks_read_pipes():
+    data = os.urandom(3000)
+    read_end, write_end = os.pipe()
+    with os.fdopen(write_end, "wb") as pipe:
+        pipe.write(data)  # Fits in the pipe buffer, so no writer thread is needed
+    try:
+        chunks = list(Lab1.iter_file_chunks(f"/dev/fd/{read_end}", chunk_size=1024))
+    finally:
+        os.close(read_end)
+    assert b"".join(chunks) == data
+    assert [len(chunk) for chunk in chunks] == [1024, 1024, 952]
+
+def test_encrypt_file_reads_pipes(tmp_path, random_bits):
+    key = random_bits(8)
+    source, from_file, from_pipe = tmp_path / "plain", tmp_path / "file.enc", tmp_path / "pipe.enc"
+    data = os.urandom(1234)
+    source.write_bytes(data)
+    Lab1.encrypt_file(source, from_file, key, 4)
+    read_end, write_end = os.pipe()
+    with os.fdopen(write_end, "wb") as pipe:
+        pipe.write(data)
+    try:
+        Lab1.encrypt_file(f"/dev/fd/{read_end}", from_pipe, key, 4)
+    finally:
+        os.close(read_end)
+    assert from_pipe.read_bytes() == from_file.read_bytes()
+    assert Lab1.STREAM_TRAILER.unpack(from_pipe.read_bytes()[-8:]) == (1234,)
@@ -0,0 +1,102 @@
+import os
+import random
+
+import pytest
+from bitarray import bitarray
+
+from ib_task import Lab2
+
+@pytest.mark.parametrize("offset, length", [(0, 8), (3, 20), (11, 50), (95, 5), (90, 40)])
+def test_decrypt_range_accepts_bytes_and_bitarray(offset, length, random_bits):
+    key, IV = random_bits(8), random_bits(8)
+    plaintext = os.urandom(100)
+    ciphertext = Lab2.encrypt_CTR(Lab2.bytestring_to_bitarray(plaintext), key, IV, 4)
+    expected = plaintext[offset:offset + length]
+    assert Lab2.decrypt_range(ciphertext.tobytes(), key, IV, offset, length, 4) == expected
+    assert Lab2.decrypt_range(ciphertext, key, IV, offset, length, 4) == expected
+
+@pytest.mark.parametrize("num_rounds", [1, 2, 4, 8])
+def test_block_words_are_bit_identical(num_rounds, random_bits):
+    key = random_bits(8)
+    blocks = [random_bits(8) for _ in range(16)]
+    words = Lab2.bitarray_to_words(sum(blocks, bitarray()))
+    encrypted = Lab2.words_to_bitarray(Lab2.encrypt_block_words(words, key, num_rounds))
+    decrypted = Lab2.words_to_bitarray(Lab2.decrypt_block_words(words, key, num_rounds))
+    assert encrypted == sum((Lab2.encrypt_block(block, key, num_rounds) for block in blocks), bitarray())
+    assert decrypted == sum((Lab2.decrypt_block(block, key, num_rounds) for block in blocks), bitarray())
+
+def random_chunks(data, rng):
+    # Random chunk sizes, with empty and short chunks so pending blocks are completed across calls
+    chunks, start = [], 0
+    while start < len(data):
+        size = rng.choice([0, 1, 3, 5, 8, 13, rng.randint(0, 64)])
+        chunks.append(data[start:start + size])
+        start += size
+    return chunks
+
+def run_stream(cipher, chunks, into):
+    output = bytearray()
+    if into:  # Every update writes into one preallocated buffer at the current offset
+        buffer = bytearray(b"\xaa" * (sum(map(len, chunks)) + 8))
+        position = 0
+        for chunk in chunks:
+            expected = cipher.output_length(len(chunk))
+            written = cipher.update_into(chunk, memoryview(buffer)[position:])
+            assert written == expected
+            position += written
+        assert buffer[position:] == b"\xaa" * (len(buffer) - position)  # Nothing written past the end
+        output += buffer[:position]
+    else:
+        for chunk in chunks:
+            expected = cipher.output_length(len(chunk))
+            result = cipher.update(chunk)
+            assert len(result) == expected
+            output += result
+    return bytes(output + cipher.finalize())
+
+# One-shot reference on the zero-padded input, truncated for the length-preserving modes
+def one_shot(function, data, key, IV, num_rounds, keep_padding=False):
+    padded = data + b"\x00" * (-len(data) % 8)
+    result = function(Lab2.bytestring_to_bitarray(padded), key, IV, num_rounds).tobytes()
+    return result if keep_padding else result[:len(data)]
+
+@pytest.mark.parametrize("into", [False, True])
+@pytest.mark.parametrize("length", [0, 1, 7, 8, 9, 63, 64, 203])
+@pytest.mark.parametrize("cipher_class, function, keep_padding", [
+    (Lab2.CBCEncryptor, Lab2.encrypt_CBC, True),
+    (Lab2.CFBEncryptor, Lab2.encrypt_CFB, False),
+    (Lab2.CFBDecryptor, Lab2.decrypt_CFB, False),
+    (Lab2.CTRCipher, Lab2.encrypt_CTR, False),
+])
+def test_stream_ciphers_match_one_shot_functions(random_bits, into, length, cipher_class, function, keep_padding):
+    key, IV = random_bits(8), random_bits(8)
+    data = os.urandom(length)
+    chunks = random_chunks(data, random.Random(length))
+    expected = one_shot(function, data, key, IV, 3, keep_padding)
+    assert run_stream(cipher_class(key, IV, 3), chunks, into) == expected
+
+@pytest.mark.parametrize("into", [False, True])
+@pytest.mark.parametrize("length", [0, 8, 64, 200])
+def test_cbc_decryptor_matches_decrypt_CBC(random_bits, into, length):
+    key, IV = random_bits(8), random_bits(8)
+    data = os.urandom(length)
+    chunks = random_chunks(data, random.Random(length))
+    expected = one_shot(Lab2.decrypt_CBC, data, key, IV, 3)
+    assert run_stream(Lab2.CBCDecryptor(key, IV, 3), chunks, into) == expected
+
+def test_stream_cipher_misuse_is_rejected(random_bits):
+    key, IV = random_bits(8), random_bits(8)
+    decryptor = Lab2.CBCDecryptor(key, IV)
+    decryptor.update(b"\x00" * 11)
+    with pytest.raises(ValueError):
+        decryptor.finalize()  # CBC ciphertext must be whole blocks
+
+    cipher = Lab2.CTRCipher(key, IV)
+    cipher.update(b"abc")
+    with pytest.raises(ValueError):
+        cipher.update_into(b"12345", bytearray(7))  # The pending 3 bytes complete a block: 8 bytes needed
+    cipher.finalize()
+    with pytest.raises(ValueError):
+        cipher.update(b"more")
+    with pytest.raises(ValueError):
+        cipher.finalize()
@@ -0,0 +1,44 @@
+import numpy as np
+import pytest
+
+from ib_task import Lab3
+
+def reference_values(seed, length, M, C, P):
+    values = []
+    for _ in range(length):
+        value, seed = Lab3.lcg(seed, M, C, P)
+        values.append(value)
+    return np.array(values)
+
+@pytest.mark.parametrize("P", [1000003, 2 ** 32, 2 ** 40 + 7, 2 ** 61 - 1, 2 ** 64, 2 ** 89 - 1])
+def test_lcg_array_matches_lcg_exactly(P):
+    M, C, seed = 6364136223846793005 % P, 1442695040888963407 % P, 12345
+    expected = reference_values(seed, 3000, M, C, P)
+    assert np.array_equal(Lab3.lcg_array(seed, 3000, M, C, P), expected)
+    chunks = np.concatenate(list(Lab3.lcg_chunks(seed, M, C, P, chunk_size=777, total=3000)))
+    assert np.array_equal(chunks, expected)
+    substream = Lab3.split_streams(seed, 3, M, C, P, method="leapfrog")[1]
+    assert np.array_equal(substream.array(500), expected[1::3][:500])
+
+def test_cycle_lengths_match_detect_cycle():
+    rng = np.random.default_rng(9)
+    for _ in range(2000):
+        P = int(rng.integers(1, 3000))
+        M, C, seed = int(rng.integers(0, 3 * P)), int(rng.integers(0, P)), int(rng.integers(0, P))
+        expected = Lab3.detect_cycle(seed, M, C, P)
+        assert Lab3.brent_cycle_length(seed, M, C, P) == expected
+        assert Lab3.lcg_cycle_length(seed, M, C, P) == expected, (seed, M, C, P)
+
+@pytest.mark.parametrize("P", [2 ** 16, 3 ** 7 * 5, 2 ** 10 * 3 ** 4])
+def test_cycle_lengths_match_brent_on_composite_moduli(P):
+    rng = np.random.default_rng(P)
+    for _ in range(100):
+        M, C, seed = (int(value) for value in rng.integers(0, P, 3))
+        assert Lab3.lcg_cycle_length(seed, M, C, P) == Lab3.brent_cycle_length(seed, M, C, P)
+
+@pytest.mark.parametrize("seed, M, C, P, period", [
+    (0, 1664525, 1013904223, 2 ** 32, 2 ** 32),  # Full period by Hull-Dobell
+    (1, 48271, 0, 2 ** 31 - 1, 2 ** 31 - 2),  # MINSTD: primitive root modulo a prime
+])
+def test_known_periods(seed, M, C, P, period):
+    assert Lab3.lcg_cycle_length(seed, M, C, P) == period
@@ -0,0 +1,137 @@
+import os
+import random
+
+import pytest
+
+from ib_task import Lab4
+
+@pytest.fixture(scope="module")
+def keypair():
+    return Lab4.generate_rsa_keys(1024)
+
+def random_split(data, rng, max_size):
+    # Chunks of random sizes, including empty ones
+    chunks, start = [], 0
+    while start < len(data):
+        size = rng.randint(0, max_size)
+        chunks.append(data[start:start + size])
+        start += size
+    return chunks
+
+@pytest.mark.parametrize("mode", ["CTR", "CFB"])
+@pytest.mark.parametrize("length", [0, 1, 7, 8, 9, 1000, 5003])
+@pytest.mark.parametrize("max_chunk", [1, 13, 4096])
+def test_envelope_round_trip_at_any_chunk_boundary(keypair, mode, length, max_chunk):
+    public_key, private_key = keypair
+    rng = random.Random(length * 31 + max_chunk)
+    plaintext = os.urandom(length)
+    envelope = b"".join(Lab4.envelope_encrypt_stream(random_split(plaintext, rng, max_chunk), public_key, mode))
+    assert len(envelope) == Lab4._ENVELOPE_HEADER.size + public_key.size_in_bytes() + length
+
+    decrypted = b"".join(Lab4.envelope_decrypt_stream(random_split(envelope, rng, max_chunk), private_key))
+    assert decrypted == plaintext
+    assert Lab4.envelope_decrypt(envelope, private_key) == plaintext
+
+def test_envelope_file_round_trip(keypair, tmp_path):
+    public_key, private_key = keypair
+    source, sealed, opened = tmp_path / "plain", tmp_path / "sealed", tmp_path / "opened"
+    source.write_bytes(os.urandom(10000))
+    Lab4.envelope_encrypt_file(source, sealed, public_key, "CFB", chunk_size=777)
+    Lab4.envelope_decrypt_file(sealed, opened, private_key, chunk_size=333)
+    assert opened.read_bytes() == source.read_bytes()
+
+@pytest.mark.parametrize("offset, value", [
+    (0, b"X"),  # Magic
+    (4, bytes([Lab4.ENVELOPE_VERSION + 1])),  # Version
+    (5, b"\x00"),  # Mode id 0 is not assigned
+    (5, b"\x7f"),  # Unknown mode id
+])
+def test_envelope_rejects_bad_header(keypair, offset, value):
+    public_key, private_key = keypair
+    envelope = bytearray(Lab4.envelope_encrypt(b"payload", public_key))
+    envelope[offset:offset + 1] = value
+    with pytest.raises(ValueError):
+        Lab4.envelope_decrypt(bytes(envelope), private_key)
+
+def test_envelope_rejects_truncated_header_and_unknown_mode(keypair):
+    public_key, private_key = keypair
+    envelope = Lab4.envelope_encrypt(b"payload", public_key)
+    with pytest.raises(ValueError):
+        Lab4.envelope_decrypt(envelope[:Lab4._ENVELOPE_HEADER.size + 10], private_key)
+    with pytest.raises(ValueError):
+        Lab4.envelope_encrypt(b"payload", public_key, mode="CBC")
+
+@pytest.mark.parametrize("format", ["PEM", "DER"])
+@pytest.mark.parametrize("passphrase", [None, "correct horse"])
+def test_key_store_saves_and_reloads(keypair, tmp_path, format, passphrase):
+    public_key, private_key = keypair
+    store = Lab4.RSAKeyStore(tmp_path, format, passphrase)
+    key_id = store.save(private_key)
+    assert store.ids() == [key_id]
+    assert key_id in store
+
+    reopened = Lab4.RSAKeyStore(tmp_path, format, passphrase)  # Empty memo: keys come from disk
+    loaded_public, loaded_private = reopened.load(key_id)
+    assert loaded_public == public_key
+    assert loaded_private == private_key
+    assert reopened.load_private(key_id) is loaded_private  # Parsed once, then memoized
+    assert Lab4.rsa_decrypt(Lab4.rsa_encrypt(b"stored", loaded_public), loaded_private) == b"stored"
+    assert oct(os.stat(reopened._path(key_id)).st_mode & 0o777) == oct(0o600)
+    assert not [name for name in os.listdir(tmp_path) if name.endswith(".tmp")]
+
+def test_key_store_needs_the_passphrase(keypair, tmp_path):
+    key_id = Lab4.RSAKeyStore(tmp_path, "PEM", "secret").save(keypair[1])
+    with pytest.raises(ValueError):
+        Lab4.RSAKeyStore(tmp_path, "PEM").load_private(key_id)
+    with pytest.raises(ValueError):
+        Lab4.RSAKeyStore(tmp_path, "PEM", "wrong").load_private(key_id)
+
+def test_key_store_formats_are_separate(keypair, tmp_path):
+    key_id = Lab4.RSAKeyStore(tmp_path, "DER").save(keypair[1])
+    assert Lab4.RSAKeyStore(tmp_path, "PEM").ids() == []
+    assert Lab4.RSAKeyStore(tmp_path, "DER").get_or_generate() == key_id
+    with pytest.raises(ValueError):
+        Lab4.RSAKeyStore(tmp_path, "JWK")
+
+@pytest.mark.parametrize("workers, chunk_size", [(1, 256), (2, 3), (2, 256)])
+def test_rsa_batches_keep_input_order(keypair, workers, chunk_size):
+    public_key, private_key = keypair
+    messages = [f"message {index}".encode() for index in range(40)]
+    encrypted = Lab4.rsa_encrypt_batch(messages, public_key, workers=workers, chunk_size=chunk_size)
+    assert [Lab4.rsa_decrypt(message, private_key) for message in encrypted] == messages
+    assert Lab4.rsa_decrypt_batch(encrypted, private_key, workers=workers, chunk_size=chunk_size) == messages
+    assert Lab4.rsa_decrypt_batch(iter(encrypted), private_key, workers=2, chunk_size=7) == messages
+
+def test_generated_private_key_carries_crt_components(keypair):
+    public_key, private_key = keypair
+    assert private_key.p * private_key.q == private_key.n == public_key.n
+    assert private_key.u == pow(private_key.p, -1, private_key.q)
+    assert Lab4.rsa_decrypt(Lab4.rsa_encrypt(b"crt", public_key), private_key) == b"crt"
+
+def test_oaep_ciphers_are_cached_per_key(keypair, monkeypatch):
+    public_key, private_key = keypair
+    assert Lab4.get_oaep_cipher(public_key) is Lab4.get_oaep_cipher(public_key)
+    assert Lab4.get_oaep_cipher(public_key) is not Lab4.get_oaep_cipher(private_key)
+    assert Lab4.get_oaep_cipher(public_key) is Lab4.get_oaep_cipher(private_key.public_key())
+
+    monkeypatch.setattr(Lab4, "RSA_CIPHER_CACHE_SIZE", 2)
+    monkeypatch.setattr(Lab4, "_cipher_cache", Lab4.OrderedDict())
+    other_public, _ = Lab4.generate_rsa_keys(1024)
+    for key in (public_key, private_key, other_public):
+        Lab4.get_oaep_cipher(key)
+    assert len(Lab4._cipher_cache) == 2
+    assert (public_key.n, public_key.e, False) not in Lab4._cipher_cache  # Least recently used goes first
+
+def test_key_pool_hands_out_working_keypairs():
+    with Lab4.RSAKeyPool(key_size=1024, watermark=2, workers=2) as pool:
+        pairs = [pool.get(timeout=60) for _ in range(3)]
+        stats = pool.stats()
+    assert len({public_key.n for public_key, _ in pairs}) == 3
+    for public_key, private_key in pairs:
+        assert private_key.public_key() == public_key
+        assert Lab4.rsa_decrypt(Lab4.rsa_encrypt(b"pooled", public_key), private_key) == b"pooled"
+    assert stats["handed_out"] == 3
+    assert stats["generated"] >= 3
+    assert stats["depth"] + stats["pending"] <= stats["watermark"]
+    with pytest.raises(ValueError):
+        pool.get()
@@ -0,0 +1,58 @@
+import random
+from collections import Counter
+
+import pytest
+
+from ib_task import Lab5
+
+def loop_counts(text, n):
+    grams = (text[i:i + n] for i in range(len(text) - n + 1))
+    return Counter(gram for gram in grams if gram.isalpha())
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 5, 64, Lab5.NGRAM_CHUNK_SIZE])
+def test_ngram_counts_do_not_depend_on_chunking(chunk_size):
+    rng = random.Random(chunk_size)
+    text = "".join(rng.choice("abcAB é,\nЖ") for _ in range(500))
+    counts = Lab5.NGramCounts(text, 3, chunk_size)
+    whole = Lab5.NGramCounts(text, 3, len(text))
+    for n in (1, 2, 3):
+        assert counts.as_dict(n) == loop_counts(text, n)
+        assert list(counts.as_dict(n)) == list(whole.as_dict(n))  # Same first-occurrence order
+        assert counts.top(n, 5) == whole.top(n, 5)
+
+def test_sparse_ngram_tables_match_dense(monkeypatch):
+    text = "the quick brown fox jumps over the lazy dog " * 20
+    dense = Lab5.NGramCounts(text, 3, 7)
+    monkeypatch.setattr(Lab5, "DENSE_NGRAM_LIMIT", 1)
+    sparse = Lab5.NGramCounts(text, 3, 7)
+    for n in (1, 2, 3):
+        assert sparse.as_dict(n) == dense.as_dict(n)
+        assert sparse.top(n, 6) == dense.top(n, 6)
+
+def test_language_model_cache(tmp_path):
+    corpus = tmp_path / "corpus.txt"
+    corpus.write_text("the quick brown fox jumps over the lazy dog " * 50, encoding="utf-8")
+    built = Lab5.load_language_model([corpus], cache_dir=tmp_path / "cache")
+    (directory,) = (tmp_path / "cache").iterdir()
+    assert sorted(path.name for path in directory.iterdir()) == sorted(name + ".npy" for name in Lab5.MODEL_TABLES)
+    cached = Lab5.load_language_model([corpus], cache_dir=tmp_path / "cache")
+    assert (cached.trigram == built.trigram).all()
+
+def test_language_model_without_writable_cache(tmp_path):
+    corpus = tmp_path / "corpus.txt"
+    corpus.write_text("hello world " * 20, encoding="utf-8")
+    blocker = tmp_path / "blocker"
+    blocker.write_text("")  # A file where the cache directory would go
+    model = Lab5.load_language_model([corpus], cache_dir=blocker / "cache")
+    assert model.letter_frequencies()["L"] > model.letter_frequencies()["Z"]
+
+@pytest.mark.parametrize("mapping, expected", [
+    ({"a": "b"}, "bbc\r\nxyz\rend\n"),  # ASCII-only: bytes.translate path
+    ({"a": "ж"}, "жbc\r\nxyz\rend\n"),  # Text path
+])
+@pytest.mark.parametrize("chunk_size", [1, 4, 1 << 22])
+def test_decode_file_keeps_line_endings(tmp_path, mapping, expected, chunk_size):
+    source, target = tmp_path / "in.txt", tmp_path / "out.txt"
+    source.write_bytes(b"abc\r\nxyz\rend\n")
+    Lab5.decode_file(source, target, mapping, chunk_size=chunk_size)
+    assert target.read_bytes() == expected.encode("utf-8")
@@ -0,0 +1,93 @@
+import struct
+import warnings
+import zlib
+
+import numpy as np
+import pytest
+from PIL import Image, ImageFile
+
+from ib_task import Lab6
+
+@pytest.fixture
+def carrier(tmp_path):
+    path = tmp_path / "carrier.png"
+    Image.fromarray(np.random.default_rng(0).integers(0, 256, (120, 90, 3), dtype=np.uint8)).save(path)
+    return path
+
+@pytest.mark.parametrize("payload", ["Привет ✓", b"\x00binary\xff" * 40, ""])
+@pytest.mark.parametrize("bits_per_channel, channels, key", [(1, "R", None), (3, "RGB", None), (2, "GB", "secret")])
+def test_payload_round_trip(carrier, tmp_path, payload, bits_per_channel, channels, key):
+    output = tmp_path / "out.png"
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", ResourceWarning)
+        Lab6.hide_payload(carrier, payload, output, bits_per_channel, channels, key)
+        assert Lab6.extract_payload(output, key) == payload
+
+def test_reads_version_1_payloads(carrier, tmp_path):
+    payload = b"version one"
+    header = struct.pack(">2sBBII", Lab6.STEGO_MAGIC, 1, 0, len(payload), zlib.crc32(payload))
+    with Image.open(carrier) as image:
+        pixels = np.array(image)
+    Lab6._embed_red_lsb(pixels, np.unpackbits(np.frombuffer(header + payload, dtype=np.uint8)))
+    Image.fromarray(pixels).save(tmp_path / "v1.png")
+    assert Lab6.extract_payload(tmp_path / "v1.png") == payload
+
+def test_small_payload_decodes_the_header_rows_once(carrier, tmp_path, monkeypatch):
+    Lab6.hide_payload(carrier, "short", tmp_path / "out.png")
+    opened = []
+    original_open = Lab6.Image.open
+    monkeypatch.setattr(Lab6.Image, "open", lambda *args: opened.append(args) or original_open(*args))
+    assert Lab6.extract_payload(tmp_path / "out.png") == "short"
+    assert len(opened) == 1
+
+def test_partial_png_decode_falls_back_to_crop(carrier, tmp_path, monkeypatch):
+    Lab6.hide_payload(carrier, "fallback", tmp_path / "out.png")
+    original_load = ImageFile.ImageFile.load
+
+    def load(image):
+        if image.size != (90, 120):  # The shrunk tile: pretend Pillow internals changed
+            raise AttributeError("_size")
+        return original_load(image)
+
+    monkeypatch.setattr(ImageFile.ImageFile, "load", load)
+    assert Lab6.extract_payload(tmp_path / "out.png") == "fallback"
+
+def test_keyed_payload_needs_the_key(carrier, tmp_path):
+    Lab6.hide_payload(carrier, "keyed", tmp_path / "out.png", key="k")
+    with pytest.raises(ValueError):
+        Lab6.extract_payload(tmp_path / "out.png")
+
+@pytest.mark.parametrize("name", ["out.jpg", "out.JPEG", "out.webp", "out.gif", "out"])
+def test_lossy_or_unknown_output_formats_are_rejected(carrier, tmp_path, name):
+    with pytest.raises(ValueError, match="lossless"):
+        Lab6.hide_payload(carrier, "hello", tmp_path / name)
+    assert not (tmp_path / name).exists()
+
+@pytest.mark.parametrize("extension", Lab6.LOSSLESS_EXTENSIONS)
+def test_lossless_output_formats_keep_the_payload(carrier, tmp_path, extension):
+    Lab6.hide_payload(carrier, "hello", tmp_path / ("out" + extension), 2, "RGB")
+    assert Lab6.extract_payload(tmp_path / ("out" + extension)) == "hello"
+
+@pytest.mark.parametrize("mode, extension", [("P", ".gif"), ("L", ".png"), ("LA", ".png"), ("CMYK", ".tif")])
+def test_carriers_without_rgb_bands_are_converted(tmp_path, mode, extension):
+    source = tmp_path / ("carrier" + extension)
+    Image.fromarray(np.random.default_rng(1).integers(0, 256, (60, 50, 3), dtype=np.uint8)).convert(mode).save(source)
+    assert Lab6.payload_capacity(source, 1, "RGB") > 0
+    Lab6.hide_payload(source, "converted", tmp_path / "out.png", 1, "RGB")
+    assert Lab6.extract_payload(tmp_path / "out.png") == "converted"
+
+def test_batch_round_trip_in_input_order(tmp_path):
+    source = tmp_path / "carriers"
+    source.mkdir()
+    rng = np.random.default_rng(2)
+    for index in range(12):
+        image = Image.fromarray(rng.integers(0, 256, (40, 40, 3), dtype=np.uint8))
+        if index % 3 == 0:
+            image.convert("P").save(source / f"img{index:02}.gif")
+        else:
+            image.save(source / f"img{index:02}.png")
+    payloads = [f"payload {index}" for index in range(12)]
+    hidden = list(Lab6.batch_hide(source, payloads, tmp_path / "out", workers=2))
+    assert all("error" not in result for result in hidden)
+    extracted = list(Lab6.batch_extract(tmp_path / "out", workers=2))
+    assert [result["payload"] for result in extracted] == payloads